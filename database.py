@@ -4,20 +4,163 @@ from typing import Optional, List, Dict
 from PyQt5.QtGui import QPixmap
 import re
 import os
-import shutil
 import traceback
+import functools
+import queue
+from contextlib import contextmanager
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
 from loguru import logger
 from utils_and_ui import get_mark_pixmap
-from file_scanner import find_files_with_content
+from file_scanner import iter_files_with_content, scan_cache_path
 from languages import language_settings
 
+# update_field에서 허용하는 컬럼과 미리 만들어 둔 SQL (컬럼 화이트리스트 겸용)
+UPDATE_FIELD_QUERIES = {
+    field: f"UPDATE file_data SET {field} = ? WHERE file_path = ?"
+    for field in (
+        "title", "author", "version", "description", "level_min", "level_max",
+        "limit_value", "play_time", "mark", "is_completed",
+    )
+}
+
+def _json_dumps(value) -> str:
+    """JSON 직렬화 (orjson 우선, 비 ASCII 문자는 그대로 저장)"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _json_loads(data):
+    """JSON 역직렬화 (orjson 우선, str/bytes 모두 허용). 잘못된 값은 ValueError"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 초기화 대상별 SET 절 (reset_all에서 한 번의 UPDATE로 합침, 태그는 file_tag 테이블에서 삭제)
+RESET_ASSIGNMENTS = {
+    "limit": "limit_value = 0",
+    "comp": "is_completed = 0",
+    "time": "play_time = NULL",
+    "mark": "mark = 'mark00'",
+}
+RESET_SCOPES = set(RESET_ASSIGNMENTS) | {"tag"}
+
+# 사용자 정의 태그 키 형식 (영문, 숫자, '_', '-'만 허용, 끝의 개행도 거부)
+_TAG_KEY_RE = re.compile(r"^[A-Za-z0-9_-]+\Z")
+
+# fetch_* 조회용 컬럼 목록 (file_tags는 jsonlist 컨버터로 바로 리스트 변환, NULL은 빈 리스트)
+FILE_DATA_SELECT = """
+    SELECT file_path, title, author, version, level_min, level_max, coupon_number, coupon_name,
+           image_paths, position_types, image_data, description, lang, modification_time,
+           limit_value, play_time, mark, IFNULL(file_tags, '[]') AS "file_tags [jsonlist]", is_completed
+    FROM file_data_view
+"""
+
+# 파일의 태그를 position 순서대로 JSON 배열로 모으는 식
+# - SQLite 3.44 이상: 집계 함수 안의 ORDER BY로 순서를 보장
+# - 그보다 오래된 버전: ORDER BY 서브쿼리를 집계하는 방식. SQLite는 서브쿼리 순서대로 집계한다고
+#   보장하지 않으므로(현재 쿼리 플랜에서만 유지됨) 시작 시 _check_file_tag_order()로 확인
+if sqlite3.sqlite_version_info >= (3, 44, 0):
+    _FILE_TAGS_EXPR = """(SELECT json_group_array(t.tag ORDER BY t.position)
+            FROM file_tag t WHERE t.file_path = f.file_path)"""
+else:
+    _FILE_TAGS_EXPR = """(SELECT json_group_array(tag) FROM (
+                SELECT t.tag FROM file_tag t WHERE t.file_path = f.file_path ORDER BY t.position
+           ))"""
+
+# 파일 태그를 file_tag 테이블에서 모아 기존과 같은 JSON 배열(file_tags)로 보여주는 호환용 뷰
+# (SQLite 버전에 따라 정의가 달라지므로 시작할 때마다 다시 만듦)
+FILE_DATA_VIEW_SQL = f"""
+    CREATE VIEW file_data_view AS
+    SELECT f.file_path, f.title, f.author, f.version, f.level_min, f.level_max, f.coupon_number,
+           f.coupon_name, f.image_paths, f.position_types, f.image_data, f.description, f.lang,
+           f.modification_time, f.limit_value, f.play_time, f.mark,
+           {_FILE_TAGS_EXPR} AS file_tags,
+           f.is_completed
+    FROM file_data f
+"""
+
+# 태그 순서 확인용 임시 파일 경로 (확인 후 롤백되어 DB에 남지 않음)
+_TAG_ORDER_PROBE_PATH = "::tag-order-check::"
+
+
+def _convert_json_list(data: bytes) -> list:
+    """file_tags 컬럼(JSON 배열)을 리스트로 변환하는 컨버터 (잘못된 값은 빈 리스트)"""
+    if not data:
+        return []
+    try:
+        value = _json_loads(data)
+    except ValueError:
+        return []
+    return value if isinstance(value, list) else []
+
+
+def _folder_range(folder_path: str) -> tuple:
+    """
+    폴더 하위 경로 조회용 범위 (하한, 상한)를 반환합니다.
+    '/' 다음 문자가 '0'이므로 [folder/, folder0) 범위가 폴더 하위 경로 전체와 일치합니다.
+    """
+    normalized_folder_path = folder_path.replace("\\", "/").rstrip("/")
+    return normalized_folder_path + "/", normalized_folder_path + "0"
+
+
+def _dict_row_factory(cursor, row) -> Dict:
+    """조회 결과를 바로 dict로 만드는 row factory"""
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+sqlite3.register_converter("jsonlist", _convert_json_list)
+
+# 스캔 결과 반영용 SQL (이름 있는 매개변수로 컬럼 순서를 한 곳에서 관리)
+_SCANNED_COLUMNS = (
+    "file_path", "title", "author", "version", "level_min", "level_max", "coupon_number", "coupon_name",
+    "image_paths", "position_types", "image_data", "description", "lang", "modification_time",
+    "limit_value", "play_time", "mark", "is_completed",
+)
+_INSERT_SQL = (
+    f"INSERT INTO file_data ({', '.join(_SCANNED_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in _SCANNED_COLUMNS)})"
+)
+_UPDATE_SQL_RESTORE = (
+    f"UPDATE file_data SET {', '.join(f'{column} = :{column}' for column in _SCANNED_COLUMNS)} "
+    "WHERE file_path = 'Deleted: ' || :file_path"
+)
+# 스캔 결과에 없는 사용자 데이터 컬럼의 기본값
+_SCANNED_DEFAULTS = {"limit_value": 0, "play_time": "", "mark": "mark00", "is_completed": 0}
+
+# 읽기 전용 연결 개수 (WAL 모드에서 쓰기와 동시에 조회 가능)
+READER_POOL_SIZE = 4
+
 class DatabaseManager:    
     def __init__(self, db_name: str = "file_data.db") -> None:
         self.db_name = db_name
-        self.connection = sqlite3.connect(self.db_name)
+        # 동일 SQL을 반복 실행하는 경우가 많으므로 문장 캐시를 넉넉하게 설정
+        self.connection = sqlite3.connect(
+            self.db_name, cached_statements=256, detect_types=sqlite3.PARSE_COLNAMES
+        )
+        # WAL 모드 및 성능 관련 PRAGMA 설정
+        # - WAL 모드에서는 DB 파일 옆에 `-wal`, `-shm` 보조 파일이 생성됩니다.
+        self.connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=2147483648;
+            PRAGMA busy_timeout=5000;
+            PRAGMA foreign_keys=ON;
+        """)
         self.connection.row_factory = sqlite3.Row
         self.cursor = self.connection.cursor()
 
+        # fetch_* 조회 전용 읽기 연결 풀 (폴더 재스캔 중에도 UI 조회가 쓰기를 기다리지 않음)
+        self.reader_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(READER_POOL_SIZE):
+            self.reader_pool.put(self._open_reader())
+
         # 관련 관리 클래스 초기화
         self.limit_manager = LimitManager(self)
         self.mark_manager = MarkManager(self)
@@ -25,11 +168,40 @@ class DatabaseManager:
         self.time_manager = TimeManager(self)
         self.comp_manager = CompManager(self)
 
+    def _open_reader(self) -> sqlite3.Connection:
+        """읽기 전용 연결을 엽니다. (행은 dict로 반환)"""
+        reader = sqlite3.connect(
+            f"file:{self.db_name}?mode=ro", uri=True, check_same_thread=False,
+            cached_statements=256, detect_types=sqlite3.PARSE_COLNAMES
+        )
+        reader.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=2147483648;
+            PRAGMA busy_timeout=5000;
+            PRAGMA query_only=ON;
+        """)
+        reader.row_factory = _dict_row_factory
+        return reader
+
+    @contextmanager
+    def reader(self):
+        """풀에서 읽기 연결을 빌려 커서를 제공하고, 끝나면 반납합니다."""
+        connection = self.reader_pool.get()
+        cursor = connection.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self.reader_pool.put(connection)
+
     def initialize_database(self) -> None:
         """데이터베이스 초기화: 테이블 생성 및 기본 데이터 설정"""
         try:
             # 테이블 생성
             self._create_tables()
+            # 기존 assets 폴더의 사용자 마크 이미지를 DB로 가져오기
+            self.mark_manager.import_mark_assets()
             # 기본 태그 초기화
             self.tag_manager.initialize_default_tags()
         except sqlite3.Error as db_error:
@@ -73,7 +245,51 @@ class DatabaseManager:
                     JP_translation TEXT
                 )
             """)
+
+            # file_tag 테이블 생성 (파일-태그 다대다 관계, 파일 경로 변경 시 함께 갱신)
+            self.cursor.executescript("""
+                CREATE TABLE IF NOT EXISTS file_tag (
+                    file_path TEXT NOT NULL
+                        REFERENCES file_data(file_path) ON UPDATE CASCADE ON DELETE CASCADE,
+                    tag TEXT NOT NULL,
+                    position INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (file_path, tag)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_file_tag_tag ON file_tag(tag);
+            """)
+            self.cursor.execute("DROP VIEW IF EXISTS file_data_view")
+            self.cursor.execute(FILE_DATA_VIEW_SQL)
+            self._migrate_file_tags()
+            self._check_file_tag_order()
+
+            # mark_assets 테이블 생성 (사용자 마크 이미지 저장)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS mark_assets (
+                    mark TEXT PRIMARY KEY,
+                    data BLOB
+                )
+            """)
+
+            # 정렬 컬럼용 인덱스 생성
+            # - 정렬 컬럼을 선두에 두어 ORDER BY가 인덱스 순서를 그대로 사용
+            # - 폴더 필터는 범위 조건이므로 file_path 기본 키 인덱스를 사용
+            self.cursor.executescript("""
+                DROP INDEX IF EXISTS idx_file_path;
+                CREATE INDEX IF NOT EXISTS idx_file_path_title ON file_data(title COLLATE NOCASE, file_path);
+                CREATE INDEX IF NOT EXISTS idx_file_path_author ON file_data(author COLLATE NOCASE, file_path);
+                CREATE INDEX IF NOT EXISTS idx_file_path_mtime ON file_data(modification_time DESC, file_path);
+                CREATE INDEX IF NOT EXISTS idx_file_path_lvlmin ON file_data(level_min COLLATE NOCASE, file_path);
+            """)
+
+            # 필터 목록용 인덱스 (SELECT DISTINCT mark/play_time을 인덱스만 읽어 처리)
+            self.cursor.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_mark ON file_data(mark);
+                CREATE INDEX IF NOT EXISTS idx_play_time ON file_data(play_time);
+            """)
             self.connection.commit()
+
+            # 쿼리 플래너 통계 갱신
+            self.cursor.execute("ANALYZE")
         except sqlite3.Error as db_error:
             logger.error(f"Database error during table creation: {db_error}")
             raise
@@ -81,92 +297,96 @@ class DatabaseManager:
             logger.error(f"Unexpected error during table creation: {e}")
             raise
     
+    def _migrate_file_tags(self) -> None:
+        """기존 file_data.file_tags(JSON)를 file_tag 테이블로 한 번만 옮깁니다. (user_version 1)"""
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= 1:
+            return
+
+        self.cursor.execute("""
+            INSERT OR IGNORE INTO file_tag (file_path, tag, position)
+            SELECT f.file_path, j.value, j.key
+            FROM file_data f, json_each(f.file_tags) j
+            WHERE json_valid(f.file_tags) AND json_type(f.file_tags) = 'array' AND j.type = 'text'
+        """)
+        self.cursor.execute("UPDATE file_data SET file_tags = NULL WHERE file_tags IS NOT NULL")
+        self.cursor.execute("PRAGMA user_version = 1")
+        logger.info("Migrated file_tags JSON to file_tag table")
+
+    def _check_file_tag_order(self) -> None:
+        """
+        file_data_view의 file_tags가 position 순서를 유지하는지 확인합니다.
+        (file_tag는 (file_path, tag) 순으로 저장되므로 태그 이름 순서와 반대인 position으로 저장해 보고 롤백)
+        """
+        expected = ["b", "a"]
+        self.cursor.execute("SAVEPOINT tag_order_check")
+        try:
+            self.cursor.execute("INSERT INTO file_data (file_path) VALUES (?)", (_TAG_ORDER_PROBE_PATH,))
+            self.cursor.executemany(
+                "INSERT INTO file_tag (file_path, tag, position) VALUES (?, ?, ?)",
+                [(_TAG_ORDER_PROBE_PATH, tag, position) for position, tag in enumerate(expected)]
+            )
+            row = self.cursor.execute(
+                "SELECT file_tags FROM file_data_view WHERE file_path = ?", (_TAG_ORDER_PROBE_PATH,)
+            ).fetchone()
+        finally:
+            self.cursor.execute("ROLLBACK TO tag_order_check")
+            self.cursor.execute("RELEASE tag_order_check")
+
+        if _json_loads(row["file_tags"]) != expected:
+            logger.warning(
+                f"SQLite {sqlite3.sqlite_version}: file_data_view가 태그 순서를 유지하지 않습니다 "
+                f"(표시되는 태그 순서가 저장된 순서와 다를 수 있음)"
+            )
+
     def fetch_file_data_count(self, folder_path: Optional[str] = None) -> int:
         """파일 데이터의 총 개수를 반환합니다. 폴더 경로를 선택적으로 필터링할 수 있습니다."""
         query = "SELECT COUNT(*) FROM file_data"
         params = ()
         if folder_path:
-            normalized_folder_path = folder_path.replace("\\", "/") + "/%"  # 슬래시로 통일하는 경우
-            query += " WHERE file_path LIKE ?"
-            params = (normalized_folder_path,)
+            query += " WHERE file_path >= ? AND file_path < ?"
+            params = _folder_range(folder_path)
         self.cursor.execute(query, params)
         return self.cursor.fetchone()[0]
     
     def update_files_for_folder(self, folder_path):
         try:
-            # ✅ 기존 데이터베이스에서 해당 폴더의 파일 경로 가져오기
-            existing_files = self.cursor.execute(
-                "SELECT file_path FROM file_data WHERE file_path LIKE ?", 
-                (folder_path.replace("\\", "/") + "/%",)
-            ).fetchall()
-            existing_file_paths = {row["file_path"] for row in existing_files}
-
-            # ✅ 폴더에서 파일 목록을 새로 스캔
-            new_files = find_files_with_content(folder_path)
-            logger.info("find_files_with_content 실행 완료")
-            new_file_paths = {file_data["file_path"] for file_data in new_files}
+            # ✅ 스캔 결과 반영은 하나의 쓰기 트랜잭션으로 처리
+            self.cursor.execute("BEGIN IMMEDIATE")
+
+            # ✅ 스캔된 경로는 임시 테이블에 적재하고, 기존 데이터와의 차이는 SQLite 조인으로 계산
+            self.cursor.execute("CREATE TEMP TABLE IF NOT EXISTS scan (file_path TEXT PRIMARY KEY)")
+            self.cursor.execute("DELETE FROM scan")
+
+            # ✅ 스캔 스레드가 만든 배치를 받는 즉시 DB에 반영 (스캔과 쓰기를 겹쳐서 진행)
+            scanned_count = 0
+            for new_files in iter_files_with_content(folder_path, cache_path=scan_cache_path(self.db_name)):
+                self._apply_scanned_batch(new_files)
+                scanned_count += len(new_files)
+            logger.info(f"find_files_with_content 실행 완료 ({scanned_count} files)")
 
             # ✅ DB에만 존재하고 폴더에는 없는 파일을 '삭제됨'으로 처리
-            files_to_mark_as_deleted = existing_file_paths - new_file_paths
-            for file_path in files_to_mark_as_deleted:
-                # ✅ 기존에 이미 "Deleted: " 상태인지 확인
-                self.cursor.execute("SELECT file_path FROM file_data WHERE file_path = ?", (f"Deleted: {file_path}",))
-                if self.cursor.fetchone():
+            # (파일별 SELECT 없이 한 번의 조인으로 '삭제됨' 행 존재 여부까지 확인)
+            rows = self.cursor.execute("""
+                SELECT f.file_path, d.file_path IS NOT NULL AS already_deleted
+                FROM file_data f
+                LEFT JOIN scan s USING (file_path)
+                LEFT JOIN file_data d ON d.file_path = 'Deleted: ' || f.file_path
+                WHERE s.file_path IS NULL AND f.file_path >= ? AND f.file_path < ?
+            """, _folder_range(folder_path)).fetchall()
+            to_mark_deleted = []
+            for row in rows:
+                file_path = row["file_path"]
+                if row["already_deleted"]:
                     logger.warning(f"File already marked as deleted: {file_path}")
                     continue
-
                 logger.info(f"Marking file as deleted: {file_path}")
-                self.cursor.execute(
-                    "UPDATE file_data SET file_path = ? WHERE file_path = ?",
-                    (f"Deleted: {file_path}", file_path)
-                )
+                to_mark_deleted.append((file_path, file_path))
 
-            # ✅ 새 파일을 데이터베이스에 삽입 또는 갱신
-            for file_data in new_files:
-                file_path = file_data["file_path"]
-                
-                # ✅ 기존에 "Deleted: file_path"로 저장된 데이터가 있는지 확인
-                self.cursor.execute("SELECT file_path FROM file_data WHERE file_path = ?", (f"Deleted: {file_path}",))
-                deleted_entry = self.cursor.fetchone()
-
-                if deleted_entry:
-                    # ✅ 기존에 삭제된 파일이 있으면 INSERT 하지 않고 UPDATE로 복구
-                    logger.info(f"Restoring deleted file: {file_path}")
-                    self.cursor.execute("""
-                        UPDATE file_data
-                        SET file_path = ?, title = ?, author = ?, version = ?, level_min = ?, level_max = ?, 
-                            coupon_number = ?, coupon_name = ?, image_paths = ?, position_types = ?, 
-                            image_data = ?, description = ?, lang = ?, modification_time = ?, 
-                            limit_value = ?, play_time = ?, mark = ?, file_tags = ?, is_completed = ?
-                        WHERE file_path = ?
-                    """, (
-                        file_path, file_data["title"], file_data["author"], file_data["version"], file_data["level_min"],
-                        file_data["level_max"], file_data["coupon_number"], file_data["coupon_name"],
-                        json.dumps(file_data["image_paths"]), json.dumps(file_data["position_types"]),
-                        None, file_data["description"], file_data["lang"], file_data["modification_time"], 
-                        file_data.get("limit_value", 0), file_data.get("play_time", ""), file_data.get("mark", "mark00"),
-                        json.dumps(file_data.get("file_tags", [])), 0, f"Deleted: {file_path}"
-                    ))
-                else:
-                    # ✅ 기존에 없으면 INSERT 수행
-                    self.cursor.execute("SELECT 1 FROM file_data WHERE file_path = ?", (file_path,))
-                    exists = self.cursor.fetchone()
-
-                    if not exists:
-                        self.cursor.execute("""
-                            INSERT INTO file_data (file_path, title, author, version, level_min, level_max, 
-                                                coupon_number, coupon_name, image_paths, position_types, 
-                                                image_data, description, lang, modification_time, 
-                                                limit_value, play_time, mark, file_tags, is_completed)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            file_path, file_data["title"], file_data["author"], file_data["version"], file_data["level_min"],
-                            file_data["level_max"], file_data["coupon_number"], file_data["coupon_name"],
-                            json.dumps(file_data["image_paths"]), json.dumps(file_data["position_types"]),
-                            None, file_data["description"], file_data["lang"], file_data["modification_time"], 
-                            file_data.get("limit_value", 0), file_data.get("play_time", ""), file_data.get("mark", "mark00"),
-                            json.dumps(file_data.get("file_tags", [])), 0
-                        ))
+            self.cursor.executemany(
+                "UPDATE file_data SET file_path = 'Deleted: ' || ? WHERE file_path = ?",
+                to_mark_deleted
+            )
 
             # ✅ 변경 사항 커밋
             self.connection.commit()
@@ -176,6 +396,7 @@ class DatabaseManager:
             tb = traceback.format_exc()
             logger.error(f"Database error in update_files_for_folder ({folder_path}): {repr(db_error)}\nTraceback:\n{tb}")
         except FileNotFoundError as fnf_error:
+            self.connection.rollback()
             tb = traceback.format_exc()
             logger.error(f"FileNotFoundError in update_files_for_folder ({folder_path}): {repr(fnf_error)}\nTraceback:\n{tb}")
         except Exception as e:
@@ -183,6 +404,51 @@ class DatabaseManager:
             tb = traceback.format_exc()
             logger.error(f"Unexpected error in update_files_for_folder ({folder_path}): {repr(e)}\nTraceback:\n{tb}")
 
+    def _apply_scanned_batch(self, new_files) -> None:
+        """스캔된 파일 배치를 scan 임시 테이블에 적재하고 새 파일을 복구(UPDATE) 또는 삽입(INSERT)"""
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO scan (file_path) VALUES (?)",
+            ((file_data["file_path"],) for file_data in new_files)
+        )
+
+        # ✅ 이전 배치의 새 파일은 이미 반영되었으므로 이번 배치의 새 파일만 조회됨
+        # (새 파일 여부와 '삭제됨' 행 존재 여부를 한 번의 조인으로 판정)
+        rows = self.cursor.execute("""
+            SELECT s.file_path, d.file_path IS NOT NULL AS was_deleted
+            FROM scan s
+            LEFT JOIN file_data f USING (file_path)
+            LEFT JOIN file_data d ON d.file_path = 'Deleted: ' || s.file_path
+            WHERE f.file_path IS NULL
+        """).fetchall()
+        files_by_path = {file_data["file_path"]: file_data for file_data in new_files}
+        to_restore = []
+        to_insert = []
+        for row in rows:
+            file_path = row["file_path"]
+            file_data = files_by_path[file_path]
+
+            params = {
+                **_SCANNED_DEFAULTS,
+                **file_data,
+                "image_paths": _json_dumps(file_data["image_paths"]),
+                "position_types": _json_dumps(file_data["position_types"]),
+                "image_data": None,
+                "is_completed": 0,
+            }
+            if row["was_deleted"]:
+                # ✅ 기존에 삭제된 파일이 있으면 INSERT 하지 않고 UPDATE로 복구
+                logger.info(f"Restoring deleted file: {file_path}")
+                to_restore.append(params)
+            else:
+                to_insert.append(params)
+
+        self.cursor.executemany(_UPDATE_SQL_RESTORE, to_restore)
+        # 복구된 파일은 다른 사용자 데이터와 마찬가지로 태그도 초기화
+        self.cursor.executemany(
+            "DELETE FROM file_tag WHERE file_path = ?", [(params["file_path"],) for params in to_restore]
+        )
+        self.cursor.executemany(_INSERT_SQL, to_insert)
+
     def update_completed_status(self, file_path: str, is_completed: int):
             self.cursor.execute(
                 "UPDATE file_data SET is_completed = ? WHERE file_path = ?", 
@@ -190,29 +456,51 @@ class DatabaseManager:
             )
             self.connection.commit()
 
-    def fetch_file_data(self, folder_path: str, page_size: int, start_index: int) -> List[Dict]:
-        """지정된 폴더와 페이지의 파일 데이터를 가져옵니다."""
-        normalized_folder_path = folder_path.replace("\\", "/") + "/%"
+    def fetch_file_data(self, folder_path: str, page_size: int, start_index: int,
+                        cursor_key: Optional[str] = None) -> List[Dict]:
+        """
+        지정된 폴더와 페이지의 파일 데이터를 가져옵니다.
+        cursor_key(이전 페이지 마지막 file_path)가 주어지면 OFFSET 대신 키셋 방식으로 조회합니다.
+        """
+        folder_range = _folder_range(folder_path)
         
         # 쿼리 실행 및 디버깅 출력
-        query = "SELECT * FROM file_data WHERE file_path LIKE ? LIMIT ? OFFSET ?"
-        self.cursor.execute(query, (normalized_folder_path, page_size, start_index))
-        
-        rows = self.cursor.fetchall()
-
-        result = []
-        for row in rows:
-            row_data = dict(row)
-            try:
-                row_data['file_tags'] = json.loads(row_data['file_tags']) if row_data['file_tags'] else []
-            except (json.JSONDecodeError, TypeError):
-                row_data['file_tags'] = []
-            result.append(row_data)
-        
-        return result
-
-    def fetch_sorted_file_data(self, folder_path, sort_field, page_size, start_index):
-        """주어진 필드로 정렬된 파일 데이터를 가져옵니다."""
+        if cursor_key is not None:
+            query = FILE_DATA_SELECT + " WHERE file_path >= ? AND file_path < ? AND file_path > ? ORDER BY file_path LIMIT ?"
+            params = folder_range + (cursor_key, page_size)
+        else:
+            query = FILE_DATA_SELECT + " WHERE file_path >= ? AND file_path < ? ORDER BY file_path LIMIT ? OFFSET ?"
+            params = folder_range + (page_size, start_index)
+
+        with self.reader() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    @staticmethod
+    def _seek_condition(sort_column: str, collate: str, sort_desc: bool, cursor_key) -> tuple:
+        """
+        키셋 페이지네이션용 WHERE 조건을 생성합니다.
+        정렬 순서는 (sort_column, file_path)이며 NULL은 ASC에서 맨 앞, DESC에서 맨 뒤에 옵니다.
+        """
+        value, last_path = cursor_key
+        column = f"{sort_column} {collate}".strip()
+        if value is None:
+            if sort_desc:
+                return f"({sort_column} IS NULL AND file_path > ?)", (last_path,)
+            return f"(({sort_column} IS NULL AND file_path > ?) OR {sort_column} IS NOT NULL)", (last_path,)
+
+        op = "<" if sort_desc else ">"
+        condition = f"({column} {op} ? OR ({column} = ? AND file_path > ?)"
+        if sort_desc:
+            condition += f" OR {sort_column} IS NULL"
+        return condition + ")", (value, value, last_path)
+
+    def fetch_sorted_file_data(self, folder_path, sort_field, page_size, start_index, cursor_key=None):
+        """
+        주어진 필드로 정렬된 파일 데이터를 가져옵니다.
+        cursor_key(이전 페이지 마지막 행의 (정렬 값, file_path))가 주어지면
+        OFFSET 대신 키셋(seek) 방식으로 다음 페이지를 조회합니다.
+        """
 
         # 필드와 쿼리 매핑
         valid_sort_fields = {
@@ -228,10 +516,8 @@ class DatabaseManager:
 
         # ✅ 특정 필드에 대해 정렬 방향 조정
         # - 'modification_time'은 최신순(DESC), 나머지는 오름차순(ASC)
-        if sort_field in ["modification_time"]:
-            sort_desc = True   # 최신 수정 시간순 (내림차순)
-        elif sort_field in ["title", "author", "level_min"]:
-            sort_desc = False  # 제목, 저자, 최소 레벨은 오름차순
+        sort_desc = sort_column == "modification_time"
+        collate = "" if sort_desc else "COLLATE NOCASE"
 
         # 매개변수 유효성 검사
         if page_size is None or page_size <= 0:
@@ -239,33 +525,35 @@ class DatabaseManager:
         if start_index is None or start_index < 0:
             start_index = 0  # 기본 시작 인덱스
 
-        # SQL 쿼리 작성
+        # SQL 쿼리 작성 (동일 값은 file_path 순으로 정렬해 순서를 고정)
+        where = "file_path >= ? AND file_path < ?"
+        params = _folder_range(folder_path)
+        if cursor_key is not None:
+            seek_sql, seek_params = self._seek_condition(sort_column, collate, sort_desc, cursor_key)
+            where += f" AND {seek_sql}"
+            params += seek_params
+
         query = f"""
-        SELECT * FROM file_data
-        WHERE file_path LIKE ?
-        ORDER BY COALESCE({sort_column}, '') {"COLLATE NOCASE" if sort_field != "modification_time" else ""} {"DESC" if sort_desc else "ASC"}
-        LIMIT ? OFFSET ?
+        {FILE_DATA_SELECT}
+        WHERE {where}
+        ORDER BY {sort_column} {collate} {"DESC" if sort_desc else "ASC"}, file_path
+        LIMIT ?
         """
+        if cursor_key is None:
+            query += " OFFSET ?"
+            params += (page_size, start_index)
+        else:
+            params += (page_size,)
 
         # 디버깅 로그 추가
-        logger.info(f"With parameters: {folder_path}%, {page_size}, {start_index}")
+        logger.info(f"With parameters: {params}")
 
         # 쿼리를 실행하고 결과 반환
         try:
-            self.cursor.execute(query, (f"{folder_path}%", page_size, start_index))
-            rows = self.cursor.fetchall()
-            logger.info(f"Rows fetched: {len(rows)}")
-
-            # 결과를 딕셔너리 리스트로 변환
-            result = []
-            for row in rows:
-                row_data = dict(row)
-                try:
-                    row_data['file_tags'] = json.loads(row_data['file_tags']) if row_data['file_tags'] else []
-                except (json.JSONDecodeError, TypeError):
-                    row_data['file_tags'] = []
-                result.append(row_data)
-
+            with self.reader() as cursor:
+                cursor.execute(query, params)
+                result = cursor.fetchall()
+            logger.info(f"Rows fetched: {len(result)}")
             return result
         except Exception as e:
             logger.error(f"Error executing query: {e}")
@@ -273,7 +561,10 @@ class DatabaseManager:
 
     def update_field(self, file_path, field, value):
         """파일의 특정 필드를 업데이트"""
-        query = f"UPDATE file_data SET {field} = ? WHERE file_path = ?"
+        query = UPDATE_FIELD_QUERIES.get(field)
+        if query is None:
+            logger.error(f"Invalid field for update: {field}")
+            return
         try:
             self.cursor.execute(query, (value, file_path))
             self.connection.commit()
@@ -289,13 +580,47 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to update level for {file_path}: {e}")
 
+    def reset_all(self, scope=None) -> bool:
+        """
+        선택한 항목(limit, comp, time, mark, tag)을 하나의 UPDATE와 한 번의 커밋으로 초기화합니다.
+        scope가 없으면 모든 항목을 초기화합니다.
+        """
+        scope = set(RESET_SCOPES) if scope is None else set(scope)
+        assignments = [RESET_ASSIGNMENTS[key] for key in RESET_ASSIGNMENTS if key in scope]
+        if not assignments and "tag" not in scope:
+            logger.warning(f"Nothing to reset for scope: {scope}")
+            return False
+
+        try:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            if assignments:
+                self.cursor.execute(f"UPDATE file_data SET {', '.join(assignments)}")
+            if "tag" in scope:
+                self.cursor.execute("DELETE FROM file_tag")
+            self.connection.commit()
+        except sqlite3.Error as db_error:
+            self.connection.rollback()
+            logger.error(f"Database error in reset_all ({scope}): {db_error}")
+            return False
+
+        if "tag" in scope:
+            self.tag_manager._notify_update()
+        return True
+
     def fetch_all_files_for_folder(self, folder_path: str) -> List[Dict]:
         """데이터베이스에서 특정 폴더 경로의 모든 파일 정보를 가져옵니다."""
-        normalized_folder_path = folder_path.replace("\\", "/") + "/%"
-        self.cursor.execute("SELECT * FROM file_data WHERE file_path LIKE ?", (normalized_folder_path,))
-        return [dict(row) for row in self.cursor.fetchall()]
+        with self.reader() as cursor:
+            cursor.execute("SELECT * FROM file_data_view WHERE file_path >= ? AND file_path < ?", _folder_range(folder_path))
+            return cursor.fetchall()
 
     def close(self) -> None:
+        try:
+            # 종료 전에 쿼리 플래너 통계 갱신
+            self.connection.execute("PRAGMA optimize;")
+        except sqlite3.Error as db_error:
+            logger.error(f"Database error during PRAGMA optimize: {db_error}")
+        while not self.reader_pool.empty():
+            self.reader_pool.get_nowait().close()
         self.connection.close()
 
 class LimitManager:   
@@ -308,9 +633,18 @@ class LimitManager:
         self.db.connection.commit()
 
     
+    def update_limits(self, pairs) -> None:
+        """(limit_value, file_path) 쌍 목록을 한 트랜잭션으로 업데이트"""
+        try:
+            self.db.cursor.executemany("UPDATE file_data SET limit_value = ? WHERE file_path = ?", pairs)
+            self.db.connection.commit()
+        except sqlite3.Error as db_error:
+            self.db.connection.rollback()
+            logger.error(f"Database error in update_limits: {db_error}")
+
+    
     def reset_limits(self) -> None:
-        self.db.cursor.execute("UPDATE file_data SET limit_value = 0")
-        self.db.connection.commit()    
+        self.db.reset_all({"limit"})    
 
 class CompManager:  
     def __init__(self, db_manager: DatabaseManager):
@@ -323,8 +657,7 @@ class CompManager:
 
     
     def reset_comps(self) -> None:
-        self.db.cursor.execute("UPDATE file_data SET is_completed = 0")
-        self.db.connection.commit()  
+        self.db.reset_all({"comp"})  
 
 class TimeManager:
     def __init__(self, db_manager: DatabaseManager):
@@ -339,8 +672,7 @@ class TimeManager:
     
     def reset_play_times(self) -> None:
         """모든 파일의 play_time을 NULL로 초기화합니다."""
-        self.db.cursor.execute("UPDATE file_data SET play_time = NULL")
-        self.db.connection.commit()
+        self.db.reset_all({"time"})
 
     
     def fetch_play_time(self, file_path: str) -> Optional[str]:
@@ -352,43 +684,97 @@ class TimeManager:
     
     def fetch_all_play_times(self) -> List[str]:
         """모든 파일의 play_time 목록을 반환합니다."""
-        self.db.cursor.execute("SELECT DISTINCT play_time FROM file_data")  # 중복 없는 모든 play_time 선택            
-        return [row["play_time"] for row in self.db.cursor.fetchall()]
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT DISTINCT play_time FROM file_data")  # 중복 없는 모든 play_time 선택
+            return [row["play_time"] for row in cursor.fetchall()]
+
+@functools.lru_cache(maxsize=256)
+def _load_pixmap_cached(mark: str, data: Optional[bytes]) -> QPixmap:
+    """
+    마크 이미지를 로드하여 캐시합니다.
+    - data가 있으면 DB에 저장된 사용자 이미지를 로드
+    - 없으면 기본 마크 이미지를 바이너리 데이터에서 로드
+    """
+    if data is not None:
+        pixmap = QPixmap()
+        if pixmap.loadFromData(data):
+            return pixmap
+        logger.error(f"[ERROR] Failed to load user image for {mark}")
+
+    pixmap = get_mark_pixmap(int(mark[4:]))  # "markXX"에서 숫자 추출하여 전달
+    if pixmap is None:
+        logger.error(f"[ERROR] Failed to load default image for {mark}")
+    return pixmap
+
 
 class MarkManager:
+    # 사용자 마크 이미지 데이터 (mark -> PNG 바이트), 모든 인스턴스가 공유
+    _mark_data: Optional[Dict[str, bytes]] = None
+
     def __init__(self, db_manager):
         self.db = db_manager
         self.base_path = os.path.abspath(".")
-        self.assets_path = os.path.join(self.base_path, "assets")  # 사용자 마크 경로
+        self.assets_path = os.path.join(self.base_path, "assets")  # 이전 버전의 사용자 마크 경로
+
+    def import_mark_assets(self) -> None:
+        """assets 폴더에 남아 있는 사용자 마크 이미지(markXX.png)를 mark_assets 테이블로 가져옵니다."""
+        try:
+            rows = []
+            with os.scandir(self.assets_path) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext.lower() == ".png" and name.startswith("mark") and entry.is_file():
+                        with open(entry.path, "rb") as image_file:
+                            rows.append((name, image_file.read()))
+
+            if rows:
+                self.db.cursor.executemany(
+                    "INSERT OR IGNORE INTO mark_assets (mark, data) VALUES (?, ?)", rows
+                )
+                self.db.connection.commit()
+            MarkManager._mark_data = None
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.db.connection.rollback()
+            logger.error(f"Error importing mark assets: {e}")
+
+    def _get_mark_data(self) -> Dict[str, bytes]:
+        """mark_assets 테이블을 한 번에 읽어 공유 캐시에 보관"""
+        if MarkManager._mark_data is None:
+            try:
+                self.db.cursor.execute("SELECT mark, data FROM mark_assets")
+                MarkManager._mark_data = {row["mark"]: row["data"] for row in self.db.cursor.fetchall()}
+            except sqlite3.Error as db_error:
+                logger.error(f"Database error loading mark assets: {db_error}")
+                return {}
+        return MarkManager._mark_data
 
     def get_mark_image(self, mark: str) -> QPixmap:
         """
         파일에 할당된 마크 이미지를 반환.
-        - 사용자 정의 이미지가 존재하면 assets 폴더에서 로드
+        - 사용자 정의 이미지가 DB에 있으면 해당 이미지를 로드
         - 없으면 기본 마크 이미지를 바이너리 데이터에서 로드
         """
-        user_image_path = os.path.join(self.assets_path, f"{mark}.png")
-
-        if os.path.exists(user_image_path):  # 사용자 이미지가 존재하면 로드
-            return QPixmap(user_image_path)
-
-        else:  # 기본 마크 이미지를 바이너리 데이터에서 로드
-            pixmap = get_mark_pixmap(int(mark[4:]))  # "markXX"에서 숫자 추출하여 전달
-            if pixmap is None:
-                logger.error(f"[ERROR] Failed to load default image for {mark}")
-            return pixmap
+        return _load_pixmap_cached(mark, self._get_mark_data().get(mark))
 
     
     def set_mark_image(self, mark: str, new_image_path: str) -> None:
         """
-        사용자가 마크 이미지를 변경하면 assets 폴더에 저장.
+        사용자가 마크 이미지를 변경하면 mark_assets 테이블에 저장.
         """
-        target_path = os.path.join(self.assets_path, f"{mark}.png")
+        with open(new_image_path, "rb") as image_file:
+            data = image_file.read()
+
+        self.db.cursor.execute(
+            "INSERT OR REPLACE INTO mark_assets (mark, data) VALUES (?, ?)", (mark, data)
+        )
+        self.db.connection.commit()
+        logger.debug(f"[INFO] New user image saved for {mark}")
 
-        # assets 폴더에 새 이미지를 복사하여 덮어쓰기
-        os.makedirs(self.assets_path, exist_ok=True)  # 폴더가 없으면 생성
-        shutil.copyfile(new_image_path, target_path)
-        logger.debug(f"[INFO] New user image saved to {target_path}")
+        # 캐시된 이미지 무효화
+        MarkManager._mark_data = None
+        _load_pixmap_cached.cache_clear()
 
     
     def update_mark(self, file_path: str, mark: str) -> None:
@@ -398,8 +784,7 @@ class MarkManager:
     
     def reset_marks(self) -> None:
         """모든 마크를 'mark00'으로 초기화합니다."""
-        self.db.cursor.execute("UPDATE file_data SET mark = 'mark00'")
-        self.db.connection.commit()
+        self.db.reset_all({"mark"})
 
     def fetch_mark(self, file_path: str) -> Optional[str]:
         self.db.cursor.execute("SELECT mark FROM file_data WHERE file_path = ?", (file_path,))
@@ -409,10 +794,16 @@ class MarkManager:
     
     def fetch_all_marks(self) -> List[str]:
         """모든 마크를 반환합니다."""
-        self.db.cursor.execute("SELECT DISTINCT mark FROM file_data")  # 중복 없는 모든 마크를 선택
-        return [row["mark"] for row in self.db.cursor.fetchall()]
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT DISTINCT mark FROM file_data")  # 중복 없는 모든 마크를 선택
+            return [row["mark"] for row in cursor.fetchall()]
 
 class TagManager:  
+    # 존재하는 태그 키 집합 (소문자, NOCASE 비교용), 모든 인스턴스가 공유하며 필요할 때 로드
+    _valid_tags_cache: Optional[set] = None
+    # 언어별 태그 번역 (locale -> {tag: 번역}), 모든 인스턴스가 공유하며 필요할 때 로드
+    _translations_cache: Optional[Dict[str, Dict[str, str]]] = None
+
     def __init__(self, db_manager):
         self.db = db_manager
         self.default_tags = ["battle", "dungeon", "explorer", "novel", "shop", "town", "item", "skill", "short", "long"]
@@ -445,60 +836,71 @@ class TagManager:
                     )
 
             self.db.connection.commit()
+            self._invalidate_tag_caches()
 
         except Exception as e:
             self.db.connection.rollback()
             logger.error(f"Error initializing default tags: {e}")
 
     
+    @staticmethod
+    def _invalidate_tag_caches():
+        """태그 키 집합과 번역 캐시를 모두 비움 (다음 조회 시 다시 로드)"""
+        TagManager._valid_tags_cache = None
+        TagManager._translations_cache = None
+
+    def _get_translations(self) -> Dict[str, str]:
+        """
+        tags_list 전체를 한 번만 읽어 언어별 번역 딕셔너리로 캐시하고, 현재 언어의 {태그 키: 번역}을 반환
+        (언어 코드는 여기서만 소문자로 맞춰 모든 조회가 같은 딕셔너리를 보도록 함)
+        """
+        if TagManager._translations_cache is None:
+            with self.db.reader() as cursor:
+                cursor.execute("SELECT tag, KR_translation, JP_translation FROM tags_list")
+                rows = cursor.fetchall()
+            TagManager._translations_cache = {
+                "kr": {row["tag"]: row["KR_translation"] for row in rows},
+                "jp": {row["tag"]: row["JP_translation"] for row in rows},
+            }
+        return TagManager._translations_cache.get(language_settings.current_locale.lower(), {})
+
+    def _get_valid_tags(self) -> set:
+        """tags_list의 태그 키 집합을 한 번만 조회하여 캐시"""
+        if TagManager._valid_tags_cache is None:
+            self.db.cursor.execute("SELECT tag FROM tags_list")
+            TagManager._valid_tags_cache = {row["tag"].lower() for row in self.db.cursor.fetchall()}
+        return TagManager._valid_tags_cache
+
     def _tag_exists(self, tag):
-        """태그 존재 여부 확인"""
-        self.db.cursor.execute("SELECT 1 FROM tags_list WHERE tag = ? COLLATE NOCASE", (tag,))
-        return self.db.cursor.fetchone() is not None
+        """태그 존재 여부 확인 (대소문자 무시)"""
+        return isinstance(tag, str) and tag.lower() in self._get_valid_tags()
     
     
     def fetch_tag_keys_with_translations(self):
         """태그 키와 현재 언어 번역을 가져옵니다."""
         try:
-            current_language = language_settings.current_locale.upper()  # 현재 언어 코드 가져오기
-            translation_column = f"{current_language}_translation"
-            self.db.cursor.execute(
-                f"SELECT tag, {translation_column} AS translation FROM tags_list"
-            )
-            result = [(row['tag'], row['translation']) for row in self.db.cursor.fetchall()]
-            return result
+            return list(self._get_translations().items())
         except Exception as e:
             logger.error(f"Error fetching tag keys with translations: {e}")
             return []
 
-    def get_tag_translation(self, tag_key):
-        """태그 키에 대한 현재 언어의 번역을 반환"""
-        language_code = language_settings.current_locale  # 현재 언어 코드 가져오기
-        translation_column = f"{language_code}_translation"  # 해당 언어의 번역 컬럼 선택
+    @property
+    def translations_map(self) -> Dict[str, str]:
+        """현재 언어의 {태그 키: 번역} 딕셔너리 (메모리 캐시 그대로 반환하므로 수정하지 말 것)"""
+        return self._get_translations()
 
-        self.db.cursor.execute(
-            f"SELECT {translation_column} FROM tags_list WHERE tag = ?",
-            (tag_key,)
-        )
-        result = self.db.cursor.fetchone()
-        return result[translation_column] if result else tag_key
+    def get_tag_translation(self, tag_key):
+        """태그 키에 대한 현재 언어의 번역을 반환 (메모리 캐시 사용)"""
+        translations = self.translations_map
+        return translations[tag_key] if tag_key in translations else tag_key
 
     
     def get_translations_for_tags(self, tag_keys):
-        """여러 태그 키에 대한 번역을 한 번에 가져옴"""
+        """여러 태그 키에 대한 번역을 한 번에 가져옴 (메모리 캐시 사용)"""
         if not tag_keys:
             return []
             
-        language_code = language_settings.current_locale  # 현재 언어 코드 가져오기
-        translation_column = f"{language_code}_translation"  # 해당 언어의 번역 컬럼 선택
-
-        placeholders = ','.join('?' * len(tag_keys))
-        self.db.cursor.execute(
-            f"SELECT tag, {translation_column} FROM tags_list WHERE tag IN ({placeholders})",
-            tuple(tag_keys)
-        )
-        translations = {row['tag']: row[translation_column] 
-                    for row in self.db.cursor.fetchall()}
+        translations = self.translations_map
         return [translations.get(key, key) for key in tag_keys]
 
     def get_tag_display_name(self, tag_key):
@@ -511,7 +913,7 @@ class TagManager:
             return
 
         # 태그 키에 허용되지 않는 문자 검사
-        if not re.match("^[a-zA-Z0-9_-]+$", tag_key):
+        if not _TAG_KEY_RE.match(tag_key):
             logger.warning("Tag key can only contain letters, numbers, underscore, and hyphen")
             return
 
@@ -534,9 +936,12 @@ class TagManager:
                     return
 
                 self.db.connection.commit()
+                self._get_valid_tags().add(tag_key.lower())
+                TagManager._translations_cache = None
                 self._notify_update()
             except Exception as e:
                 self.db.connection.rollback()
+                self._invalidate_tag_caches()
                 logger.error(f"Error adding custom tag: {e}")
 
     
@@ -551,6 +956,7 @@ class TagManager:
                     (translation_text, old_tag)
                 )
                 self.db.connection.commit()
+                TagManager._translations_cache = None
                 self._notify_update()
                 return
 
@@ -565,12 +971,17 @@ class TagManager:
                     (new_tag_key, translation_text, old_tag)
                 )
                 # 파일 태그 업데이트는 같은 트랜잭션 내에서 수행
-                self.update_file_tags_after_changes(old_tag, new_tag_key)
+                self.update_file_tags_after_changes(old_tag, new_tag_key, _no_commit=True)
 
                 self.db.connection.commit()
+                valid_tags = self._get_valid_tags()
+                valid_tags.discard(old_tag.lower())
+                valid_tags.add(new_tag_key.lower())
+                TagManager._translations_cache = None
                 self._notify_update()
         except Exception as e:
             self.db.connection.rollback()
+            self._invalidate_tag_caches()
             logger.error(f"Error updating tag: {e}")
 
     
@@ -579,92 +990,90 @@ class TagManager:
         try:
             if tag not in self.default_tags and self._tag_exists(tag):
                 self.db.cursor.execute("DELETE FROM tags_list WHERE tag = ?", (tag,))
-                self.update_file_tags_after_changes(tag)
+                self.update_file_tags_after_changes(tag, _no_commit=True)
                 self.db.connection.commit()
+                self._get_valid_tags().discard(tag.lower())
+                TagManager._translations_cache = None
                 self._notify_update()
         except Exception as e:
             self.db.connection.rollback()
+            self._invalidate_tag_caches()
             logger.error(f"Error deleting custom tag: {e}")
 
     
     def fetch_tags_for_file(self, file_path):
         """파일의 태그 목록을 가져옵니다."""
         try:
-            self.db.cursor.execute("SELECT file_tags FROM file_data WHERE file_path = ?", (file_path,))
-            result = self.db.cursor.fetchone()
-            if result and result["file_tags"]:
-                file_tags = result["file_tags"]
-                if isinstance(file_tags, str):
-                    try:
-                        tags = json.loads(file_tags)
-                        if isinstance(tags, list):
-                            return tags
-                        logger.error(f"Invalid tag format for {file_path}: {tags}")
-                    except json.JSONDecodeError:
-                        logger.error(f"JSON decoding error for tags in {file_path}: {file_tags}")
-            return []
+            self.db.cursor.execute(
+                "SELECT tag FROM file_tag WHERE file_path = ? ORDER BY position", (file_path,)
+            )
+            return [row["tag"] for row in self.db.cursor.fetchall()]
         except Exception as e:
             logger.error(f"Error fetching tags for file {file_path}: {e}")
             return []
 
     
-    def update_tags_for_file(self, file_path, tags):
-        """파일의 태그 목록을 업데이트"""
+    def update_tags_for_file(self, file_path, tags, _no_commit=False):
+        """
+        파일의 태그 목록을 업데이트
+        _no_commit=True이면 호출한 쪽의 트랜잭션 안에서 실행하고 커밋하지 않습니다.
+        """
         try:
             # 태그 목록 유효성 검사 추가
             if not isinstance(tags, list):
                 logger.error(f"Invalid tags format: {tags}")
                 return
                 
-            # 각 태그가 실제 존재하는 태그키인지 확인
+            # 각 태그가 실제 존재하는 태그키인지 확인 (태그 집합 스냅샷으로 비교, SQL 조회 없음)
+            known_tags = self._get_valid_tags()
             valid_tags = []
             for tag in tags:
-                if self._tag_exists(tag):
+                if isinstance(tag, str) and tag.lower() in known_tags:
                     valid_tags.append(tag)
                 else:
                     logger.warning(f"Skipping invalid tag: {tag}")
                     
-            tags_json = json.dumps(valid_tags, ensure_ascii=False)
-            
-            self.db.cursor.execute(
-                "UPDATE file_data SET file_tags = ? WHERE file_path = ?",
-                (tags_json, file_path)
+            self.db.cursor.execute("DELETE FROM file_tag WHERE file_path = ?", (file_path,))
+            self.db.cursor.executemany(
+                "INSERT OR IGNORE INTO file_tag (file_path, tag, position) VALUES (?, ?, ?)",
+                [(file_path, tag, position) for position, tag in enumerate(valid_tags)]
             )
-            self.db.connection.commit()
+            if not _no_commit:
+                self.db.connection.commit()
         except Exception as e:
             logger.error(f"Error updating tags for file {file_path}: {e}")
+            if _no_commit:
+                raise
             self.db.connection.rollback()
 
     
-    def update_file_tags_after_changes(self, old_tag, new_tag=None):
-        """태그 변경/삭제 시 모든 파일의 태그 업데이트"""
+    def update_file_tags_after_changes(self, old_tag, new_tag=None, _no_commit=False):
+        """
+        태그 변경/삭제 시 모든 파일의 태그 업데이트 (file_tag 테이블에서 처리)
+        _no_commit=True이면 호출한 쪽의 트랜잭션 안에서 실행하고 커밋하지 않습니다.
+        """
         try:
-            self.db.cursor.execute("SELECT file_path, file_tags FROM file_data WHERE file_tags IS NOT NULL")
-            for file in self.db.cursor.fetchall():
-                try:
-                    current_tags = json.loads(file['file_tags']) if file['file_tags'] else []
-                    if old_tag in current_tags:
-                        if new_tag:
-                            current_tags[current_tags.index(old_tag)] = new_tag
-                        else:
-                            current_tags.remove(old_tag)
-                        self.update_tags_for_file(file['file_path'], current_tags)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error updating tags for file {file['file_path']}: {e}")
-            self.db.connection.commit()  
+            if not self.db.connection.in_transaction:
+                self.db.cursor.execute("BEGIN IMMEDIATE")
+
+            if new_tag:
+                # 태그 이름 변경 (이미 새 태그가 있는 파일은 기존 태그만 삭제됨)
+                self.db.cursor.execute("UPDATE OR IGNORE file_tag SET tag = ? WHERE tag = ?", (new_tag, old_tag))
+            # 태그 삭제 (이름 변경 시에는 남은 중복 항목 정리)
+            self.db.cursor.execute("DELETE FROM file_tag WHERE tag = ?", (old_tag,))
+
+            if not _no_commit:
+                self.db.connection.commit()
         except Exception as e:
+            if _no_commit:
+                raise
             self.db.connection.rollback()
+            logger.error(f"Error updating file tags after tag change ({old_tag} -> {new_tag}): {e}")
 
     
     def reset_file_tags(self):
         """모든 파일별 태그를 삭제합니다."""
-        try:
-            self.db.cursor.execute("UPDATE file_data SET file_tags = '[]'")
-            self.db.connection.commit()
-            self._notify_update()
-        except Exception as e:
-            self.db.connection.rollback()
-            logger.error(f"Error resetting file tags: {e}")
+        self.db.reset_all({"tag"})
 
     
     def delete_all_custom_tags(self):
@@ -688,12 +1097,14 @@ class TagManager:
             
             # 각 태그에 대해 파일 태그 업데이트
             for tag in tags_to_delete:
-                self.update_file_tags_after_changes(tag)
+                self.update_file_tags_after_changes(tag, _no_commit=True)
                 
             self.db.connection.commit()
+            self._invalidate_tag_caches()
             self._notify_update()
         except Exception as e:
             self.db.connection.rollback()
+            self._invalidate_tag_caches()
             logger.error(f"Error deleting all custom tags: {e}")
 
     
@@ -1,12 +1,18 @@
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QMessageBox, QHBoxLayout, QComboBox, QPushButton, QTextEdit
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QPixmap, QImage, QColor
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QBuffer, QIODevice
+from PyQt5.QtGui import QFont, QPixmap, QImage, QPainter, QImageReader
 from loguru import logger
 import chardet
 import zipfile
 import os
 import json
 import traceback
+import threading
+import functools
+import html
+import itertools
+import mmap
+from collections import OrderedDict
 from file_scanner import load_image_data
 from languages import language_settings
 from utils_and_ui import JapaneseZipHandler
@@ -15,83 +21,204 @@ def sanitize_path(image_path):
     # Windows 경로에서 \을 /로 변환하되, 유니코드 문자가 손상되지 않도록 처리
     return image_path.replace("\\", "/") if "\\" in image_path and not image_path.startswith("\\u") else image_path
 
-def set_font(family_kr, family_jp, size, lang):
-    font_family = "batang" if lang == "kr" else "MS Mincho" if lang == "jp" else "Arial"
-    font = QFont(font_family, size)
-    font.setBold(True)
+def _ensure_list(value, name="value"):
+    """None이면 빈 리스트, 리스트는 그대로, JSON 문자열은 리스트로 변환합니다."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        logger.error(f"Error: Invalid JSON format for {name}")
+        return []
+
+@functools.lru_cache(maxsize=None)
+def _cached_font(family, size, bold, italic):
+    """(폰트, 크기, 굵게, 기울임)별 QFont를 한 번만 만들어 캐시 (사용 시 복사본 사용)"""
+    font = QFont(family, size)
+    font.setBold(bold)
+    font.setItalic(italic)
     return font
 
-def make_background_transparent(pixmap):
+def _font_family_for_lang(lang):
+    return "batang" if lang == "kr" else "MS Mincho" if lang == "jp" else "Arial"
+
+def set_font(family_kr, family_jp, size, lang):
+    return QFont(_cached_font(_font_family_for_lang(lang), size, True, False))
+
+def make_background_transparent(source):
     """
     이미지에서 배경색과 정확히 일치하는 픽셀만 투명화합니다.
+    - 팔레트(인덱스 색상) 이미지: 배경색 팔레트 항목만 투명하게 바꿔 픽셀 순회 없이 처리
+    - 그 외: 픽셀 비교와 알파 채널 설정을 Qt 내부에서 한 번에 처리
     
-    :param pixmap: 투명화할 QPixmap 객체
-    :return: 투명화된 QPixmap
+    :param source: 투명화할 QImage 또는 QPixmap 객체
+    :return: 투명화된 이미지 (입력과 같은 타입)
     """
-    image = pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+    is_pixmap = isinstance(source, QPixmap)
+    image = source.toImage() if is_pixmap else QImage(source)
     if image.isNull():
         logger.error("Failed to convert image.")
-        return pixmap
-
-    # 배경색을 왼쪽 상단 픽셀의 색상으로 설정
-    background_color = QColor(image.pixel(0, 0))
+        return source
 
+    # 네 모서리 중 세 곳 이상이 왼쪽 상단과 같은 색이 아니면 단색 배경이 아니므로 그대로 반환
     width, height = image.width(), image.height()
-
-    # 모든 픽셀을 순회하면서 배경색과 정확히 일치하는 픽셀만 투명하게 만듭니다.
-    for x in range(width):
-        for y in range(height):
-            if QColor(image.pixel(x, y)) == background_color:
-                image.setPixelColor(x, y, QColor(255, 255, 255, 0))  # 투명화
-
-    return QPixmap.fromImage(image)
+    corners = [image.pixel(0, 0), image.pixel(width - 1, 0), image.pixel(0, height - 1), image.pixel(width - 1, height - 1)]
+    if corners.count(corners[0]) < 3:
+        return source
+
+    background = corners[0]
+    if image.colorCount() > 0:
+        # 배경색과 같은 팔레트 항목의 알파만 0으로 변경 (BMP/GIF 등)
+        image.setColorTable([color & 0x00FFFFFF if color == background else color for color in image.colorTable()])
+    else:
+        # 배경색(왼쪽 상단 픽셀)과 정확히 일치하는 픽셀만 알파 0으로 만듭니다.
+        image = image.convertToFormat(QImage.Format_ARGB32)
+        image.setAlphaChannel(image.createMaskFromColor(background, Qt.MaskOutColor))
+
+    return QPixmap.fromImage(image) if is_pixmap else image
+
+# 배경 투명화 결과 캐시 ((경로, 수정 시각, 크기 또는 내부 파일명) -> 이미지), 오래된 항목부터 제거
+# (이미지 디코딩 작업 스레드에서 함께 사용하므로 잠금으로 보호)
+_TRANSPARENT_CACHE_SIZE = 128
+_transparent_cache = OrderedDict()
+_transparent_cache_lock = threading.Lock()
+
+def make_background_transparent_cached(cache_key, image):
+    """같은 이미지를 다시 열 때는 이전에 투명화한 결과를 재사용합니다."""
+    with _transparent_cache_lock:
+        cached = _transparent_cache.get(cache_key)
+        if cached is not None:
+            _transparent_cache.move_to_end(cache_key)
+            return cached
+
+    transparent_image = make_background_transparent(image)
+    with _transparent_cache_lock:
+        _transparent_cache[cache_key] = transparent_image
+        if len(_transparent_cache) > _TRANSPARENT_CACHE_SIZE:
+            _transparent_cache.popitem(last=False)
+    return transparent_image
+
+# 텍스트 뷰어에 표시할 최대 바이트 수 (그보다 큰 파일은 잘라서 표시)
+MAX_TXT_BYTES = 2 * 1024 * 1024
+TRUNCATED_NOTICE = "\n\n[... truncated ...]"
+
+def read_txt_limited(file):
+    """
+    파일 객체에서 최대 MAX_TXT_BYTES까지 읽습니다. -> (데이터, 잘림 여부)
+    잘린 경우 멀티바이트 문자가 중간에 끊기지 않도록 마지막 줄바꿈 뒤에서 자릅니다.
+    """
+    file_data = file.read(MAX_TXT_BYTES + 1)
+    if len(file_data) <= MAX_TXT_BYTES:
+        return file_data, False
+
+    file_data = file_data[:MAX_TXT_BYTES]
+    cut = file_data.rfind(b"\n") + 1 or MAX_TXT_BYTES
+    if file_data.startswith((b'\xff\xfe', b'\xfe\xff')):
+        cut -= cut % 2  # UTF-16은 2바이트 단위 유지
+    return file_data[:cut], True
+
+# 대소문자 조합별 .txt 확장자 (파일명마다 lower()를 호출하지 않고 endswith로 비교)
+_TXT_SUFFIXES = tuple(sorted({"".join(chars) for chars in itertools.product(*zip(".txt", ".TXT"))}))
+
+# 열린 ZIP 핸들러 캐시 ((경로, 수정 시각) -> JapaneseZipHandler), 같은 ZIP의 중앙 디렉터리를 다시 읽지 않도록 재사용
+_ZIP_HANDLER_CACHE_SIZE = 8
+_zip_handlers = OrderedDict()
+
+def get_zip_handler(zip_path):
+    """ZIP 파일을 열린 상태로 캐시하여 반환합니다. (오래된 핸들러는 닫고 제거)"""
+    cache_key = (zip_path, os.path.getmtime(zip_path))
+    handler = _zip_handlers.get(cache_key)
+    if handler is not None:
+        _zip_handlers.move_to_end(cache_key)
+        return handler
+
+    # 같은 ZIP이 수정된 경우 이전 수정 시각의 핸들러는 바로 닫음 (Windows에서 파일 잠금 방지)
+    for stale_key in [key for key in _zip_handlers if key[0] == zip_path]:
+        _zip_handlers.pop(stale_key).__exit__(None, None, None)
+
+    handler = JapaneseZipHandler(zip_path).__enter__()
+    _zip_handlers[cache_key] = handler
+    if len(_zip_handlers) > _ZIP_HANDLER_CACHE_SIZE:
+        _, old_handler = _zip_handlers.popitem(last=False)
+        old_handler.__exit__(None, None, None)
+    return handler
+
+def close_zip_handlers():
+    """캐시된 ZIP 핸들러를 모두 닫습니다."""
+    for handler in _zip_handlers.values():
+        handler.__exit__(None, None, None)
+    _zip_handlers.clear()
+
+def _read_image(reader, buffer, image_data, image_format):
+    """재사용하는 QBuffer/QImageReader로 이미지 데이터를 디코딩합니다. (image_format이 비어 있으면 자동 판별)"""
+    buffer.setData(image_data)
+    buffer.open(QIODevice.ReadOnly)
+    try:
+        reader.setDevice(buffer)
+        reader.setFormat(image_format)
+        return reader.read()
+    finally:
+        buffer.close()
 
 def extract_images_from_wsn(file_path, image_paths):
-
-    # JSON 문자열일 경우, 리스트로 변환
-    if isinstance(image_paths, str):
-        try:
-            image_paths = json.loads(image_paths)
-        except json.JSONDecodeError:
-            logger.error("Error: Invalid JSON format for image_paths")
-            return []
-
-    images = []
+    """WSN 내부의 이미지들을 QImage 리스트로 반환합니다. (image_paths는 리스트)"""
+    # image_paths와 같은 순서로 결과를 채움 (찾지 못한 이미지는 None)
+    images = [None] * len(image_paths)
     with zipfile.ZipFile(file_path, 'r') as wsn_file:
-        for image_path in image_paths:
-            if image_path in wsn_file.namelist():
-                with wsn_file.open(image_path) as image_file:
-                    image_data = image_file.read()
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data)
-                    images.append(pixmap)
+        entries = {info.filename: info for info in wsn_file.infolist()}  # 이름 조회는 한 번만
+        found = []
+        for index, image_path in enumerate(image_paths):
+            if image_path in entries:
+                found.append((entries[image_path], index))
             else:
                 logger.warning(f"Image not found: {image_path}")
+
+        # ZIP 내 저장 위치 순서로 읽어 파일을 앞에서부터 한 번만 훑음
+        # (QBuffer와 QImageReader는 하나만 만들어 모든 이미지에 재사용)
+        found.sort(key=lambda item: item[0].header_offset)
+        buffer = QBuffer()
+        reader = QImageReader()
+        for info, index in found:
+            with wsn_file.open(info) as image_file:
+                image_data = image_file.read()
+            # 확장자를 형식 힌트로 QImage 디코딩 (QPixmap 변환은 표시 직전에 수행)
+            image_format = os.path.splitext(info.filename)[1].lstrip('.').upper().encode()
+            image = _read_image(reader, buffer, image_data, image_format)
+            if image.isNull():  # 확장자와 실제 형식이 다르면 내용으로 형식 판별
+                image = _read_image(reader, buffer, image_data, b"")
+            if image.isNull():
+                logger.warning(f"Failed to decode image: {info.filename} ({reader.errorString()})")
+                continue
+            images[index] = image
     return images
 
-def get_pixmap_from_image_data(file_path):
+def get_image_from_image_data(file_path):
     """
-    특정 파일의 이미지 데이터를 로드하여 QPixmap으로 반환합니다.
+    특정 파일의 이미지 데이터를 로드하여 QImage로 반환합니다.
+    (QPixmap과 달리 작업 스레드에서도 사용할 수 있음)
     """
-    pixmap = QPixmap()
-    
     # file_path가 파일인지 확인
     if not os.path.isfile(file_path):
         logger.error(f"Error: {file_path} is not a valid file path.")
         return None
     
     try:
-        with open(file_path, 'rb') as file:
-            image_data = file.read()
-            pixmap.loadFromData(image_data)    
-        return pixmap
+        # 파일을 메모리 매핑하여 bytes 복사 없이 바로 디코딩
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+            image = QImage.fromData(image_data)
+        return None if image.isNull() else image
     except Exception as e:
         logger.error(f"Error loading image data from {file_path}: {e}")
         return None
 
+# 인코딩 감지에 사용할 최대 바이트 수 (chardet은 빈도 통계 기반이므로 앞부분 표본으로 충분)
+ENCODING_SAMPLE_SIZE = 65536
+
 def detect_encoding(file_data):
     """파일 데이터를 기반으로 인코딩을 감지하는 함수"""
-    result = chardet.detect(file_data)  
+    result = chardet.detect(file_data[:ENCODING_SAMPLE_SIZE])
     encoding = result['encoding']
 
     if encoding is None:
@@ -99,6 +226,104 @@ def detect_encoding(file_data):
 
     return encoding
 
+# 상세 창 배경(Bill.png) 이미지, 처음 사용할 때 한 번만 로드
+_BILL_PIXMAP = None
+
+def _bill():
+    """배경 이미지 QPixmap을 캐시하여 반환합니다."""
+    global _BILL_PIXMAP
+    if _BILL_PIXMAP is None:
+        _BILL_PIXMAP = QPixmap(os.path.join(os.path.abspath("."), "assets", "Bill.png"))
+    return _BILL_PIXMAP
+
+
+class _DecodeSignals(QObject):
+    """이미지 디코딩 작업 결과 전달용 시그널 (작업 스레드 -> GUI 스레드)"""
+    done = pyqtSignal(int, QImage)
+    failed = pyqtSignal(str)
+
+
+class _DecodeJob(QRunnable):
+    """
+    이미지 읽기, 디코딩, 배경 투명화를 QThreadPool 작업 스레드에서 수행합니다.
+    load_images는 (인덱스, QImage) 쌍을 차례로 돌려주는 함수이며,
+    QPixmap 생성은 GUI 스레드의 슬롯에서 합니다.
+    """
+    def __init__(self, load_images, error_message):
+        super().__init__()
+        self.load_images = load_images
+        self.error_message = error_message
+        self.signals = _DecodeSignals()
+
+    def run(self):
+        try:
+            for index, image in self.load_images():
+                self.signals.done.emit(index, image)
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.error(f"{self.error_message}: {e}\nTraceback:\n{tb}")
+            self.signals.failed.emit(f"{self.error_message}: {e}")
+
+
+def _is_effectively_opaque(image):
+    """
+    알파 채널이 없거나, 있어도 모든 픽셀이 불투명(알파 255)이면 True를 반환합니다.
+    (알파 값만 Alpha8 형식으로 뽑아 행 단위 바이트 비교로 확인)
+    """
+    if not image.hasAlphaChannel():
+        return True
+
+    alpha = image.convertToFormat(QImage.Format_Alpha8)
+    width, stride = alpha.width(), alpha.bytesPerLine()
+    data = alpha.constBits().asstring(alpha.sizeInBytes())
+    opaque_row = b"\xff" * width
+    return all(data[offset:offset + width] == opaque_row for offset in range(0, len(data), stride))
+
+
+def _load_folder_image(index, full_image_path):
+    """폴더 시나리오의 이미지 파일을 읽고 필요하면 배경을 투명화"""
+    image = get_image_from_image_data(full_image_path)
+    if image is None:
+        logger.error(f"[ERROR] Failed to load image for {full_image_path}")
+        return
+    # PNG 파일이 투명하지 않으면 (알파 채널이 있어도 모두 불투명하면) 배경 투명화 처리
+    if full_image_path.lower().endswith('.png') and _is_effectively_opaque(image):
+        stat = os.stat(full_image_path)
+        cache_key = (full_image_path, stat.st_mtime, stat.st_size)
+        image = make_background_transparent_cached(cache_key, image)
+    yield index, image
+
+
+def _load_wsn_images(file_path, image_paths):
+    """WSN(ZIP) 내부 이미지를 한 번에 읽고 형식에 따라 배경을 투명화"""
+    wsn_mtime = os.path.getmtime(file_path)
+    overlay_images = extract_images_from_wsn(file_path, image_paths)
+    for index, (overlay_image, image_path) in enumerate(zip(overlay_images, image_paths)):
+        if overlay_image is None:
+            continue
+        cache_key = (file_path, wsn_mtime, image_path)
+        if image_path.lower().endswith(('.bmp', '.gif')):
+            overlay_image = make_background_transparent_cached(cache_key, overlay_image)
+        elif image_path.lower().endswith('.png') and _is_effectively_opaque(overlay_image):
+            overlay_image = make_background_transparent_cached(cache_key, overlay_image)
+        yield index, overlay_image
+
+
+def _load_wsm_image(file_path):
+    """WSM 파일에 포함된 이미지 데이터를 디코딩하고 배경을 투명화"""
+    image_data = load_image_data(file_path)
+    if not image_data:
+        logger.warning(f"Image data could not be loaded from {file_path}.")
+        return
+
+    image = QImage.fromData(image_data)
+    if image.isNull():
+        raise ValueError(f"Failed to create image from image_data in file {file_path}")
+
+    logger.info("Image loaded successfully from image_data.")
+    yield 0, (make_background_transparent(image) if _is_effectively_opaque(image) else image)
+
+
 class ScenarioDetailViewer(QDialog):
     def __init__(self, file_path, level_min, level_max, title, description, image_paths, position_types, lang, master=None):
         super().__init__(master)
@@ -112,8 +337,9 @@ class ScenarioDetailViewer(QDialog):
         self.level_max = level_max
         self.title = title
         self.description = description
-        self.image_paths = image_paths
-        self.position_types = position_types
+        # JSON 문자열은 여기서 한 번만 리스트로 변환
+        self.image_paths = _ensure_list(image_paths, "image_paths")
+        self.position_types = _ensure_list(position_types, "position_types")
         self.lang = lang
         self.setWindowTitle(title)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -122,33 +348,20 @@ class ScenarioDetailViewer(QDialog):
         layout = QVBoxLayout(self)
         self.setLayout(layout)
 
-        base_path = os.path.abspath(".") 
-        background_image_path = os.path.join(base_path, "assets", "Bill.png")  # 배경 이미지 경로 설정
         self.background_label = QLabel(self)  # 인스턴스 변수로 설정
-        background_pixmap = QPixmap(background_image_path)
+        background_pixmap = _bill()  # 캐시된 배경 이미지 사용
         self.background_label.setPixmap(background_pixmap)
         self.background_label.setGeometry(0, 0, self.width(), self.height())
         self.background_label.setAlignment(Qt.AlignCenter)
 
-        if isinstance(self.position_types, str):
-            try:
-                self.position_types = json.loads(self.position_types)  # JSON 문자열을 리스트로 변환
-            except json.JSONDecodeError:
-                logger.error("Error: Invalid JSON format for position_types")
-                self.position_types = []
-
         if level_min and level_max and (level_min != "0" or level_max != "0"):
             translated_label = language_settings.translate("summary.level_label")  
             level_text = f"{translated_label} {level_min}" if level_min == level_max else f"{translated_label} {level_min}~{level_max}"
             
             level_label = QLabel(level_text, self)
 
-            if language_settings.current_locale == "kr":
-                font = QFont("batang", 10, QFont.Bold, italic=True)  # 한국어 폰트
-            elif language_settings.current_locale == "jp":
-                font = QFont("MS Mincho", 10, QFont.Bold, italic=True)  # 일본어 폰트
-            else:
-                font = QFont("Arial", 10, QFont.Bold, italic=True)  # 기본 폰트 (기타 언어)
+            # 한국어 batang, 일본어 MS Mincho, 기타 언어 Arial
+            font = QFont(_cached_font(_font_family_for_lang(language_settings.current_locale), 10, True, True))
 
             level_label.setFont(font)
             logger.debug(f"Applying font: {font.family()}")
@@ -169,96 +382,98 @@ class ScenarioDetailViewer(QDialog):
         line_height = 15
         start_x, start_y = 65, 180
         description_lines = description.split('\\n')
-        for i, line in enumerate(description_lines):
-            description_label = QLabel(line, self)
-            description_label.setFont(set_font("batang", "MS Mincho", 10, lang))
-            description_label.setStyleSheet("color: black;")
-            description_label.adjustSize()
-            description_label.move(start_x, start_y + i * line_height)
-            description_label.show()
+        # 줄마다 QLabel을 만들지 않고, 고정 줄 높이의 리치 텍스트 QLabel 하나로 표시
+        description_html = "<br>".join(html.escape(line) for line in description_lines)
+        description_label = QLabel(self)
+        description_label.setTextFormat(Qt.RichText)
+        description_label.setText(
+            f'<p style="line-height: {line_height}px; -qt-line-height-type: fixed; margin: 0; white-space: pre;">'
+            f'{description_html}</p>'
+        )
+        description_label.setFont(set_font("batang", "MS Mincho", 10, lang))
+        description_label.setStyleSheet("color: black;")
+        description_label.adjustSize()
+        description_label.move(start_x, start_y)
+        description_label.show()
 
         self.display_images()
         
     def display_images(self):
-        overlay_photos = []
-
-        # JSON 문자열일 경우, 리스트로 변환
-        if isinstance(self.image_paths, str):
-            try:
-                self.image_paths = json.loads(self.image_paths)
-            except json.JSONDecodeError:
-                logger.error("Error: Invalid JSON format for image_paths")
-                return
+        """이미지 디코딩을 작업 스레드에 맡기고, 완료된 이미지부터 배경에 합성하여 표시"""
+        self._decode_jobs = []
+        self._overlay_pixmaps = {}  # 이미지 인덱스 -> 디코딩된 QPixmap
 
-        # file_path가 폴더일 경우
+        # file_path가 폴더일 경우 (이미지마다 별도 작업으로 병렬 디코딩)
         if os.path.isdir(self.file_path):
-            for image_path in self.image_paths:
+            for index, image_path in enumerate(self.image_paths):
                 sanitized_path = sanitize_path(image_path)
                 full_image_path = os.path.join(self.file_path, sanitized_path)
 
                 if os.path.isfile(full_image_path):
-                    pixmap = get_pixmap_from_image_data(full_image_path)
-                    if pixmap:
-                        # PNG 파일이 투명하지 않으면 배경 투명화 처리
-                        if full_image_path.lower().endswith('.png') and not pixmap.hasAlphaChannel():
-                            transparent_image = make_background_transparent(pixmap)
-                        else:
-                            transparent_image = pixmap
-                        overlay_photos.append(transparent_image)
-                    else:
-                        logger.error(f"[ERROR] Failed to load pixmap for {full_image_path}")
+                    self._start_decode_job(
+                        lambda index=index, path=full_image_path: _load_folder_image(index, path),
+                        f"Failed to load image {full_image_path}"
+                    )
                 else:
                     logger.warning(f"Image not found in folder: {full_image_path}")
 
         elif self.file_path.lower().endswith('.wsn') and self.image_paths:
-            try:
-                overlay_images = extract_images_from_wsn(self.file_path, self.image_paths)
-                for overlay_image, image_path in zip(overlay_images, self.image_paths):
-                    if image_path.lower().endswith(('.bmp', '.gif')):
-                        transparent_image = make_background_transparent(overlay_image)
-                    elif image_path.lower().endswith('.png') and not overlay_image.hasAlphaChannel():
-                        transparent_image = make_background_transparent(overlay_image)
-                    else:
-                        transparent_image = overlay_image
-                    overlay_photos.append(transparent_image)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to extract image from WSN file: {e}")
-                return
+            image_paths = list(self.image_paths)
+            self._start_decode_job(
+                lambda: _load_wsn_images(self.file_path, image_paths),
+                "Failed to extract image from WSN file"
+            )
 
         elif self.file_path.lower().endswith('.wsm'):
-            image_data = load_image_data(self.file_path)
+            file_path = self.file_path
+            self._start_decode_job(
+                lambda: _load_wsm_image(file_path),
+                "Failed to load image data from WSM file"
+            )
 
-            if image_data:
-                pixmap = QPixmap()
-                load_success = pixmap.loadFromData(image_data)
-
-                if load_success:
-                    logger.info("Image loaded successfully from image_data.")
-                    transparent_image = make_background_transparent(pixmap) if not pixmap.hasAlphaChannel() else pixmap
-                    overlay_photos.append(transparent_image)
-                else:
-                    logger.error(f"Failed to create pixmap from image_data in file {self.file_path}.")
-                    QMessageBox.critical(self, "Error", "Failed to load image data from WSM file.")
-                    return
-            else:
-                logger.warning(f"Image data could not be loaded from {self.file_path}.")
-
-        if not overlay_photos:
+        if not self._decode_jobs:
             logger.warning("No images to display.")
-            return
 
-        for i, overlay_photo in enumerate(overlay_photos):
-            position_type = self.position_types[i] if i < len(self.position_types) else None
-            image_label = QLabel(self)
-            image_label.setPixmap(overlay_photo)
-            image_label.setParent(self.background_label)
+    def _start_decode_job(self, load_images, error_message):
+        """디코딩 작업을 전역 QThreadPool에 등록"""
+        job = _DecodeJob(load_images, error_message)
+        job.signals.done.connect(self._on_image_decoded)
+        job.signals.failed.connect(self._on_image_failed)
+        self._decode_jobs.append(job)  # 작업이 끝날 때까지 시그널 객체 유지
+        QThreadPool.globalInstance().start(job)
+
+    def _on_image_decoded(self, index, image):
+        """작업 스레드에서 디코딩된 이미지를 GUI 스레드에서 QPixmap으로 변환해 표시"""
+        self._overlay_pixmaps[index] = QPixmap.fromImage(image)
+        self._compose_background()
+
+    def _compose_background(self):
+        """
+        배경 이미지와 지금까지 디코딩된 이미지들을 하나의 QPixmap으로 합성해 배경 라벨에 설정합니다.
+        (이미지마다 QLabel을 만들지 않고, 완료 순서와 관계없이 인덱스 순서로 겹침)
+        """
+        width, height = self.background_label.width(), self.background_label.height()
+        composed = QPixmap(width, height)
+        composed.fill(Qt.transparent)
+
+        painter = QPainter(composed)
+        background_pixmap = _bill()
+        painter.drawPixmap((width - background_pixmap.width()) // 2, (height - background_pixmap.height()) // 2, background_pixmap)
+        for index in sorted(self._overlay_pixmaps):
+            overlay_photo = self._overlay_pixmaps[index]
+            position_type = self.position_types[index] if index < len(self.position_types) else None
             if position_type == "Center":
                 x = (400 - overlay_photo.width()) // 2
                 y = (370 - overlay_photo.height()) // 2
             else:
                 x, y = 163, 70
-            image_label.move(x, y)
-            image_label.show()
+            painter.drawPixmap(x, y, overlay_photo)
+        painter.end()
+
+        self.background_label.setPixmap(composed)
+
+    def _on_image_failed(self, message):
+        QMessageBox.critical(self, "Error", message)
 
     def show_details(self):
         self.exec_()
@@ -272,6 +487,7 @@ class InfoDetailViewer(QDialog):
         self.scenario_ext = os.path.splitext(file_path)[1]
         self.lang = lang
         self.txt_files = self.get_all_txt_files()
+        self._txt_cache = {}  # 내부 경로 -> 디코딩된 텍스트 (드롭다운 재선택 시 재사용)
         self.font_size = 10
         self._setup_ui()
 
@@ -334,27 +550,36 @@ class InfoDetailViewer(QDialog):
         elif os.path.isdir(self.file_path):
             txt_files.extend(self._get_txt_files_from_folder(self.file_path))
 
-        # ✅ 정렬 기준을 display 값으로 변경
-        txt_files.sort(key=lambda x: ('read' not in x["display"].lower(), x["display"].lower()))
+        # ✅ 정렬 기준을 display 값으로 변경 ('read'가 들어간 파일 우선, 소문자 변환은 항목당 한 번)
+        txt_files.sort(key=self._txt_sort_key)
         return txt_files
 
 
 
+    @staticmethod
+    def _txt_sort_key(file_info):
+        display = file_info["display"].lower()
+        return ('read' not in display, display)
+
     def _get_txt_files_from_zip(self, zip_path):
         """ZIP 파일 내 .txt 파일만 반환 (파일명 디코딩 적용)"""
         txt_files = []
-        if zipfile.is_zipfile(zip_path):
-            with JapaneseZipHandler(zip_path) as zip_handler:
-                for orig_name in zip_handler._zip_ref.namelist():
-                    if orig_name.lower().endswith(".txt"):  # ✅ .txt 파일만 필터링
-                        decoded_name = zip_handler.get_real_filename_for_txt(orig_name)
-                        if decoded_name:
-                            txt_files.append({
-                                "original": f"{zip_path}||{orig_name}",
-                                "display": decoded_name
-                            })
-        else:
+        try:
+            zip_handler = get_zip_handler(zip_path)
+        except (zipfile.BadZipFile, OSError):
             logger.warning(f"{zip_path} is not a valid ZIP file.")
+            return txt_files
+
+        for info in zip_handler._zip_ref.infolist():
+            orig_name = info.filename
+            if not orig_name.endswith(_TXT_SUFFIXES):  # ✅ .txt 파일만 필터링
+                continue
+            decoded_name = zip_handler.get_real_filename_for_txt(orig_name)
+            if decoded_name:
+                txt_files.append({
+                    "original": f"{zip_path}||{orig_name}",
+                    "display": decoded_name
+                })
         return txt_files
 
 
@@ -363,20 +588,26 @@ class InfoDetailViewer(QDialog):
         txt_files = []
         folder_path = os.path.normpath(folder_path)
         
-        if os.path.exists(folder_path) and os.path.isdir(folder_path):
-            for file in os.listdir(folder_path):
-                if file.lower().endswith(".txt"):
-                    full_path = os.path.join(folder_path, file).replace("\\", "/")
-                    txt_files.append({
-                        "original": full_path,       # 내부에서 사용할 전체 경로
-                        "display": file              # 사용자에게 보여줄 파일명
-                    })
+        if os.path.isdir(folder_path):
+            # scandir의 DirEntry는 이름, 경로, 파일 여부를 디렉터리 읽기 결과에서 바로 제공
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_TXT_SUFFIXES) and entry.is_file():
+                        txt_files.append({
+                            "original": entry.path.replace("\\", "/"),  # 내부에서 사용할 전체 경로
+                            "display": entry.name                       # 사용자에게 보여줄 파일명
+                        })
         return txt_files
 
     def on_file_selected(self, index):
         """TXT 파일 선택 시 내용 로드"""
         selected_file = self.dropdown.itemData(index)  # 내부 경로 가져오기
 
+        # 이미 읽은 파일은 다시 열거나 디코딩하지 않음
+        if selected_file in self._txt_cache:
+            self.text_area.setPlainText(self._txt_cache[selected_file])
+            return
+
         if ".zip||" in selected_file or ".wsn||" in selected_file:
             self.load_zip_txt_content(selected_file)
         else:
@@ -402,11 +633,14 @@ class InfoDetailViewer(QDialog):
             zip_path = path_parts[0]
             inner_file = path_parts[1]
 
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                with zip_ref.open(inner_file) as txt_file:
-                    file_data = txt_file.read()
-                    content = self.decode_file_data(file_data)  # 여러 인코딩 자동 감지
-                    self.text_area.setPlainText(content)
+            zip_ref = get_zip_handler(zip_path)._zip_ref  # 캐시된 ZIP 핸들 재사용
+            with zip_ref.open(inner_file) as txt_file:
+                file_data, truncated = read_txt_limited(txt_file)
+                content = self.decode_file_data(file_data, self.lang)  # 여러 인코딩 자동 감지
+                if truncated:
+                    content += TRUNCATED_NOTICE
+                self.text_area.setPlainText(content)
+                self._txt_cache[file_path] = content
 
         except Exception as e:
             tb = traceback.format_exc()
@@ -421,24 +655,31 @@ class InfoDetailViewer(QDialog):
                 zip_path, inner_file = file_path.split("||", 1)  # ZIP 경로와 내부 파일 경로 분리
                 zip_path = os.path.normpath(zip_path).replace("\\", "/")  # 경로 정리
 
-                if zipfile.is_zipfile(zip_path):
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        if inner_file.lower().endswith(".txt"):
-                            with zip_ref.open(inner_file) as file:
-                                file_data = file.read()
-                                content = self.decode_file_data(file_data)  # 여러 인코딩 자동 감지
-                                self.text_area.setPlainText(content)
-                else:
+                try:
+                    zip_ref = get_zip_handler(zip_path)._zip_ref  # 캐시된 ZIP 핸들 재사용
+                except zipfile.BadZipFile:
                     logger.error(f"ZIP 파일을 열 수 없습니다: {zip_path}")
                     QMessageBox.critical(self, "Error", f"Failed to open ZIP file: {zip_path}")
                     return
 
+                if inner_file.lower().endswith(".txt"):
+                    with zip_ref.open(inner_file) as file:
+                        file_data, truncated = read_txt_limited(file)
+                        content = self.decode_file_data(file_data, self.lang)  # 여러 인코딩 자동 감지
+                        if truncated:
+                            content += TRUNCATED_NOTICE
+                        self.text_area.setPlainText(content)
+                        self._txt_cache[file_path] = content
+
             else:
                 # 일반 파일일 경우
                 with open(file_path, 'rb') as file:
-                    file_data = file.read()
-                    content = self.decode_file_data(file_data)  # 여러 인코딩 자동 감지
+                    file_data, truncated = read_txt_limited(file)
+                    content = self.decode_file_data(file_data, self.lang)  # 여러 인코딩 자동 감지
+                    if truncated:
+                        content += TRUNCATED_NOTICE
                     self.text_area.setPlainText(content)
+                    self._txt_cache[file_path] = content
 
         except Exception as e:
             tb = traceback.format_exc()
@@ -446,8 +687,8 @@ class InfoDetailViewer(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
 
     @staticmethod
-    def decode_file_data(file_data):
-        """파일 데이터를 여러 인코딩으로 디코딩"""
+    def decode_file_data(file_data, lang=None):
+        """파일 데이터를 여러 인코딩으로 디코딩 (lang이 'jp'이면 일본어 인코딩을 감지보다 먼저 시도)"""
         encodings = ["utf-8", "shift_jis", "cp932", "euc-jp", "gb18030", "latin-1"]
         
         # 🔍 파일에서 BOM 확인 후 인코딩 결정
@@ -457,6 +698,22 @@ class InfoDetailViewer(QDialog):
             return file_data.decode("utf-16-le")  # UTF-16 LE
         elif file_data.startswith(b'\xfe\xff'):
             return file_data.decode("utf-16-be")  # UTF-16 BE
+
+        # ⚡ ASCII / UTF-8 파일은 인코딩 감지 없이 바로 디코딩
+        if file_data.isascii():
+            return file_data.decode("ascii")
+        try:
+            return file_data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+        # ⚡ 일본어 시나리오는 대부분 Shift_JIS 계열이므로 인코딩 감지 전에 먼저 시도
+        if lang == "jp":
+            for enc in ("cp932", "shift_jis", "euc-jp"):
+                try:
+                    return file_data.decode(enc)
+                except UnicodeDecodeError:
+                    continue
         
         # 🔍 기본 인코딩 감지 후 시도
         try:
@@ -491,6 +748,16 @@ class InfoDetailViewer(QDialog):
             self.font_size -= 2
             self.set_font_by_lang()
 
+    def closeEvent(self, event):
+        """창을 닫을 때 캐시된 ZIP 핸들을 정리"""
+        close_zip_handlers()
+        super().closeEvent(event)
+
+    def done(self, result):
+        """Esc 등으로 closeEvent 없이 닫힐 때도 캐시된 ZIP 핸들을 정리"""
+        close_zip_handlers()
+        super().done(result)
+
     def show_details(self):
         """Info 창을 표시"""
         self.show()
@@ -2,13 +2,22 @@
 
 import os
 import zipfile
-import xml.etree.ElementTree as ET
-import chardet  # 인코딩 감지를 위한 라이브러리
+from lxml import etree
 import re
-from typing import List, Union, Optional, Literal, Type, BinaryIO
+from typing import List, Tuple, Union, Optional, Literal, Type, BinaryIO
 import struct
+import codecs
 import io
 import types
+import functools
+import contextlib
+import collections
+import sqlite3
+import pickle
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from PyQt5.QtWidgets import QMessageBox
 from loguru import logger
 
@@ -26,19 +35,48 @@ language_code = None
 
 def encodewrap(s: str) -> str:
     """改行コードを\nに置換する。"""
-    r = []
     if not s:
         return ""
-    for c in s:
-        if c == '\\':
-            r.append("\\\\")
-        elif c == '\n':
-            r.append("\\n")
-        elif c == '\r':
-            pass
-        else:
-            r.append(c)
-    return "".join(r)
+    # 역슬래시를 먼저 이스케이프해야 뒤에서 넣는 \n이 다시 이스케이프되지 않음
+    return s.replace("\\", "\\\\").replace("\r", "").replace("\n", "\\n")
+
+# 포맷 문자열을 매 호출마다 해석하지 않도록 미리 컴파일한 언패커
+_S_BYTE = struct.Struct("b").unpack
+_S_WORD = struct.Struct("<h").unpack
+_S_DWORD = struct.Struct("<l").unpack
+_S_BYTE_FROM = struct.Struct("b").unpack_from
+_S_WORD_FROM = struct.Struct("<h").unpack_from
+_S_DWORD_FROM = struct.Struct("<l").unpack_from
+# WSM 헤더/꼬리의 연속된 dword 3개를 한 번에 언팩
+_S_DWORD3_FROM = struct.Struct("<lll").unpack_from
+# area_id // 10000 -> (WSM 버전, area_id에서 뺄 값), 표에 없는 50000 이상은 _WSM_VERSION_LATEST
+_WSM_VERSIONS = {0: (0, 0), 1: (0, 0), 2: (2, 20000), 3: (2, 20000), 4: (4, 40000)}
+_WSM_VERSION_LATEST = (7, 70000)
+_DECODE_CP932 = codecs.getdecoder("cp932")
+
+# CWFile 읽기 버퍼 크기와, 통째로 메모리에 읽어 들일 최대 파일 크기
+_CWFILE_BUFFER_SIZE = 64 * 1024
+_CWFILE_READALL_LIMIT = 4 * 1024 * 1024
+# 스캔 중 WSM을 읽어 들일 bytearray를 재사용하는 풀 (스레드 안전, 최근에 반납한 버퍼부터 사용)
+_CWFILE_POOL_SIZE = 8
+_CWFILE_BUF_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=_CWFILE_POOL_SIZE)
+
+def _acquire_buffer(size: int) -> bytearray:
+    """풀에서 size 바이트 이상인 버퍼를 꺼내고, 없거나 작으면 새로 만듭니다."""
+    try:
+        buf = _CWFILE_BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = None
+    if buf is None or len(buf) < size:
+        buf = bytearray(max(size, _CWFILE_BUFFER_SIZE))
+    return buf
+
+def _release_buffer(buf: bytearray) -> None:
+    """버퍼를 풀에 반납합니다. 풀이 가득 차 있으면 그냥 버림."""
+    try:
+        _CWFILE_BUF_POOL.put_nowait(buf)
+    except queue.Full:
+        pass
 
 class CWFile(object):
     """CardWirthの生成したバイナリファイルを
@@ -47,14 +85,17 @@ class CWFile(object):
     cwfile.CWFile("test/Area1.wid", "rb")
     とやるとインスタンスオブジェクトが生成できる。
     """
+    # 파일마다 만들어지므로 인스턴스 __dict__를 두지 않음
+    __slots__ = ('_f', 'filename', 'decodewrap')
+
     def __init__(self, path: str, mode: str, decodewrap: bool = False,
                  f: Optional[BinaryIO] = None) -> None:
         if f:
-            self._f: Union[BinaryIO, io.BufferedReader] = f
+            self._f: Union[BinaryIO, io.BufferedReader, io.BytesIO] = f
         else:
-            self._f = io.BufferedReader(io.FileIO(path, mode))
+            # 작은 파일은 open_cwfile()이 BytesCWFile로 열고, 여기는 큰 파일용 버퍼 읽기
+            self._f = io.BufferedReader(io.FileIO(path, mode), buffer_size=_CWFILE_BUFFER_SIZE)
         self.filename = path
-        self.filedata: List[bytes] = []
         self.decodewrap = decodewrap
 
     def __enter__(self) -> "CWFile":
@@ -72,6 +113,9 @@ class CWFile(object):
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         return self._f.seek(offset, whence)
 
+    def seekable(self) -> bool:
+        return self._f.seekable()
+
     def boolean(self) -> bool:
         """byteの値を真偽値にして返す。"""
         if self.byte():
@@ -103,30 +147,25 @@ class CWFile(object):
 
     def byte(self) -> int:
         """byteの値を符号付きで返す。"""
-        raw_data = self.read(1)
-        value: int = struct.unpack("b", raw_data)[0]
+        value: int = _S_BYTE(self.read(1))[0]
         return value
 
     def ubyte(self) -> int:
         """符号無しbyteの値を符号付きで返す。"""
-        raw_data = self.read(1)
-        value: int = struct.unpack("B", raw_data)[0]
+        value: int = self.read(1)[0]
         return value
 
     def dword(self) -> int:
         """dwordの値(4byte)を符号付きで返す。リトルエンディアン。"""
-        raw_data = self.read(4)
-        assert len(raw_data) == 4, len(raw_data)
-        value: int = struct.unpack("<l", raw_data)[0]
+        value: int = _S_DWORD(self.read(4))[0]
         return value
 
     def word(self) -> int:
         """wordの値(2byte)を符号付きで返す。リトルエンディアン。"""
-        raw_data = self.read(2)
-        value: int = struct.unpack("<h", raw_data)[0]
+        value: int = _S_WORD(self.read(2))[0]
         return value
 
-    def image(self) -> Optional[bytes]:
+    def image(self) -> Optional[Union[bytes, memoryview]]:
         """dwordの値で読み込んだ画像のバイナリデータを返す。
         dwordの値が"0"だったらNoneを返す。
         """
@@ -139,67 +178,168 @@ class CWFile(object):
 
     def read(self, n: Optional[int] = None) -> bytes:
         if n is None:
-            assert self._f.seekable()
-            pos = self._f.tell()
-            self._f.seek(0, io.SEEK_END)
-            endpos = self._f.tell()
-            self._f.seek(pos, io.SEEK_SET)
-            n = endpos - pos
-        raw_data = self._f.read(n)
-        self.filedata.append(raw_data)
+            # 끝까지 읽기 (ZIP 스트림처럼 끝으로 seek하는 비용이 큰 경우도 있으므로 seek 없이 읽음)
+            raw_data = self._f.read()
+        else:
+            raw_data = self._f.read(n)
         return raw_data
 
 
+class BytesCWFile(CWFile):
+    """
+    메모리에 읽어 둔 WSM 전체 바이트 위에서 동작하는 CWFile.
+    read()와 image()가 새 bytes를 만들지 않고 원본 버퍼의 memoryview 구간을 반환합니다.
+    (QImage.fromData 등 버퍼 프로토콜을 받는 곳에는 그대로 넘길 수 있음)
+    pool_buffer를 넘기면 close() 때 그 버퍼를 풀에 반납하므로, 반환받은 구간은 close() 전까지만 유효합니다.
+    """
+    __slots__ = ('_buf', '_mv', '_pos', '_pool_buffer')
+
+    def __init__(self, data: Union[bytes, memoryview], path: Optional[str] = None,
+                 decodewrap: bool = False, pool_buffer: Optional[bytearray] = None) -> None:
+        self.filename = path
+        self.decodewrap = decodewrap
+        self._buf = data
+        self._mv = memoryview(data)
+        self._pos = 0
+        self._pool_buffer = pool_buffer
+
+    def __enter__(self) -> "BytesCWFile":
+        return self
+
+    def close(self) -> None:
+        # 풀 버퍼가 아니면 반환한 memoryview 구간이 계속 유효하도록 버퍼는 해제하지 않음
+        if self._pool_buffer is not None:
+            self._buf = self._mv = b''
+            _release_buffer(self._pool_buffer)
+            self._pool_buffer = None
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buf)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def seekable(self) -> bool:
+        return True
+
+    # 정수 필드는 슬라이스를 만들지 않고 버퍼에서 바로 언팩
+    def byte(self) -> int:
+        value: int = _S_BYTE_FROM(self._buf, self._pos)[0]
+        self._pos += 1
+        return value
+
+    def ubyte(self) -> int:
+        value: int = self._buf[self._pos]
+        self._pos += 1
+        return value
+
+    def dword(self) -> int:
+        value: int = _S_DWORD_FROM(self._buf, self._pos)[0]
+        self._pos += 4
+        return value
+
+    def word(self) -> int:
+        value: int = _S_WORD_FROM(self._buf, self._pos)[0]
+        self._pos += 2
+        return value
+
+    def getvalue(self) -> bytes:
+        """버퍼 전체를 bytes로 반환 (bytes로 만든 경우 복사 없이 원본 객체를 그대로 반환)"""
+        if isinstance(self._buf, bytes):
+            return self._buf
+        return bytes(self._buf)
+
+    def read(self, n: Optional[int] = None) -> memoryview:
+        start = min(self._pos, len(self._buf))
+        end = len(self._buf) if n is None or n < 0 else min(start + n, len(self._buf))
+        self._pos = end
+        return self._mv[start:end]
+
+
+def open_cwfile(path: str, decodewrap: bool = False, pooled: bool = False) -> CWFile:
+    """
+    WSM 파일을 CWFile로 엽니다.
+    작은 파일(대부분의 WSM)은 한 번에 읽어 BytesCWFile의 오프셋 커서로 파싱하고, 큰 파일만 버퍼 읽기를 사용합니다.
+    pooled=True면 풀의 버퍼에 읽어 들이고 close() 때 반납합니다 (결과를 close() 전에 모두 복사하는 스캔용).
+    """
+    with io.FileIO(path, 'rb') as raw:
+        size = os.fstat(raw.fileno()).st_size
+        if size <= _CWFILE_READALL_LIMIT:
+            if not pooled:
+                return BytesCWFile(raw.readall(), path, decodewrap)
+            buf = _acquire_buffer(size)
+            view = memoryview(buf)[:size]
+            n = raw.readinto(view) or 0
+            return BytesCWFile(view[:n], path, decodewrap, pool_buffer=buf)
+    return CWFile(path, 'rb', decodewrap)
+
+
 # SummaryFileReader 클래스 정의
 from typing import List, Union, Optional
 
 class SummaryFileReader:
-    def __init__(self, f: "CWFile", file_path: str):
+    def __init__(self, f: "CWFile", file_path: str, load_image: bool = False):
         self.file = f
         self.file_path = file_path  
+        self.load_image = load_image  # False면 이미지 바이트를 읽지 않고 건너뜀 (스캔용)
         self.steps = [] 
         self.flags = []  
 
     def read_summary_data(self) -> List[Union[str, int]]:
-        # 필수 데이터 추출
-        image_data = self.file.image()
-        name = self.file.string()
-        description = self.file.string()
-        author = self.file.string()
-        required_coupons = self.file.string(True)
-        required_coupons_num = self.file.dword()
-        area_id = self.file.dword()
-
-        # 버전 정보 및 area_id 조정
-        if area_id <= 19999:
-            version = 0
-        elif area_id <= 39999:
-            version = 2
-            area_id -= 20000
-        elif area_id <= 49999:
-            version = 4
-            area_id -= 40000
+        # 이미지는 CWFile로 읽고, 나머지는 한 번에 읽어 버퍼 위에서 오프셋으로 파싱
+        if self.load_image:
+            image_data = self.file.image()
         else:
-            version = 7
-            area_id -= 70000
-
-        # steps 데이터를 기존 방식으로 처리
-        steps_num = self.file.dword()
-        self.steps = [Step(self, self.file) for _ in range(steps_num)]  # 각 Step 객체 생성
-
-        # flags 데이터를 기존 방식으로 처리
-        flags_num = self.file.dword()
-        self.flags = [Flag(self, self.file) for _ in range(flags_num)]  # 각 Flag 객체 생성
+            # 스캔 결과에는 이미지가 쓰이지 않으므로 (load_image_data에서만 필요) 길이만 읽고 건너뜀
+            image_data = None
+            image_size = self.file.dword()
+            if image_size > 0 and self.file.seekable():
+                self.file.seek(image_size, io.SEEK_CUR)
+            elif image_size:
+                self.file.read(image_size)
+        buf = self.file.read()
+        ints, spans = _scan_wsm(buf)
+        strings = _decode_spans(buf, spans)
 
-        # 불명 데이터 건너뛰기
-        _ = self.file.dword()
+        # 필수 데이터 추출
+        name, description, author, required_coupons = strings[:4]
+        if not self.file.decodewrap:
+            required_coupons = encodewrap(required_coupons)
+        required_coupons_num, area_id = ints[:2]
+
+        # 버전 정보 및 area_id 조정 (1만 단위 구간으로 표 조회, 음수는 버전 0)
+        version, area_offset = (_WSM_VERSIONS.get(area_id // 10000, _WSM_VERSION_LATEST)
+                                if area_id >= 0 else _WSM_VERSIONS[0])
+        area_id -= area_offset
+
+        # steps 데이터 (이름 1 + 변수명 10개의 문자열, 기본값 1개의 정수)
+        si, ii = 4, 2
+        steps_num = ints[ii]
+        ii += 1
+        self.steps = []
+        for _ in range(steps_num):
+            self.steps.append(Step(strings[si], ints[ii], tuple(strings[si + 1:si + 11])))
+            si += 11
+            ii += 1
+
+        # flags 데이터 (이름 1 + 변수명 2개의 문자열, 기본값 1개의 정수)
+        flags_num = ints[ii]
+        ii += 1
+        self.flags = []
+        for _ in range(flags_num):
+            self.flags.append(Flag(strings[si], bool(ints[ii]), tuple(strings[si + 1:si + 3])))
+            si += 3
+            ii += 1
 
         # level_min 및 level_max 읽기
         level_min = 0
         level_max = 0
         if version > 0:
-            level_min = self.file.dword()
-            level_max = self.file.dword()
+            level_min, level_max = ints[ii:ii + 2]
 
         # extracted_info에 데이터 저장
         extracted_info = {
@@ -236,18 +376,109 @@ class SummaryFileReader:
             self.file_path  # file_path 추가
         )
 
-# Step 및 Flag 클래스 정의 (이전과 동일하게 유지)
-class Step:
-    def __init__(self, parent: SummaryFileReader, f: "CWFile"):
-        self.name = f.string()
-        self.default = f.dword()
-        self.variable_names = [f.string() for _ in range(10)]
+# Step 및 Flag 정의 (_scan_wsm 결과를 한 번에 채우는 namedtuple, variable_names는 tuple)
+Step = collections.namedtuple('Step', 'name default variable_names')
+Flag = collections.namedtuple('Flag', 'name default variable_names')
+
+
+def _scan_strings(buf, pos: int, count: int, spans: List[Tuple[int, int]]) -> int:
+    """
+    pos부터 길이(dword) 접두 문자열 count개를 연속으로 훑어 spans에 (offset, length)를 추가하고 다음 위치를 반환합니다.
+    (Step의 변수명 10개처럼 연속된 문자열을 함수 호출 한 번으로 처리)
+    """
+    unpack = _S_DWORD_FROM
+    size = len(buf)
+    append = spans.append
+    for _ in range(count):
+        length, = unpack(buf, pos)
+        pos += 4
+        if length == 0:
+            # 빈 문자열 (Step 변수명 등 대부분)
+            append((pos, 0))
+            continue
+        # 음수 길이는 CWFile.read와 같이 끝까지 읽은 것으로 처리
+        end = pos + length
+        if length < 0 or end > size:
+            end = size
+        # str.strip("\x00")과 같도록 뒤쪽(보통 종단 NUL 하나)과 앞쪽의 NUL 바이트를 구간에서 제외
+        stop = end
+        while stop > pos and buf[stop - 1] == 0:
+            stop -= 1
+        start = pos
+        while start < stop and buf[start] == 0:
+            start += 1
+        append((start, stop - start))
+        pos = end
+    return pos
+
+# 변수명 10개가 모두 빈 Step의 길이 필드 (dword 0 x 10)와 그에 해당하는 빈 문자열 구간
+_STEP_EMPTY_NAMES_SIZE = 4 * 10
+_STEP_EMPTY_NAMES = bytes(_STEP_EMPTY_NAMES_SIZE)
+_STEP_EMPTY_SPANS = ((0, 0),) * 10
+
+def _decode_spans(buf, spans: List[Tuple[int, int]]) -> List[str]:
+    """
+    _scan_wsm의 문자열 구간을 CP932로 디코딩합니다.
+    빈 문자열이 아닌 구간만 NUL로 이어 붙여 디코더를 한 번만 호출한 뒤 NUL로 다시 나눕니다.
+    (앞뒤 NUL은 _scan_wsm에서 잘라냈으므로, 구간 안에 NUL이 있어 개수가 어긋날 때만 구간별로 디코딩)
+    """
+    mv = memoryview(buf)
+    decode = _DECODE_CP932
+    pieces = [mv[o:o + n] for o, n in spans if n]
+    parts = decode(b"\x00".join(pieces), "replace")[0].split("\x00")
+    if len(parts) != len(pieces):
+        parts = [decode(piece, "replace")[0] for piece in pieces]
+    # 빈 문자열 (Step/Flag 변수명 대부분)은 디코더를 거치지 않음
+    it = iter(parts)
+    return [next(it) if n else '' for _, n in spans]
+
+def _scan_wsm(buf: bytes) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """
+    Summary.wsm의 이미지 뒤 부분을 한 번에 훑어 정수값과 문자열 구간을 방문 순서대로 반환합니다.
+    문자열은 앞뒤 NUL을 제외한 (offset, length)만 기록하고 디코딩은 호출 측에서 합니다. (길이 0인 구간의 offset은 의미 없음)
+    - 문자열: 이름, 설명, 작자, 필요 쿠폰 / Step마다 이름+변수명 10개 / Flag마다 이름+변수명 2개
+    - 정수: 쿠폰 개수, area_id, steps 수, Step 기본값들, flags 수, Flag 기본값들, (버전 > 0이면) 레벨 min/max
+    """
+    unpack = _S_DWORD_FROM
+    ints: List[int] = []
+    spans: List[Tuple[int, int]] = []
+
+    pos = _scan_strings(buf, 0, 4, spans)
+    # 필요 쿠폰 개수, area_id, steps 수
+    header = _S_DWORD3_FROM(buf, pos)
+    ints.extend(header)
+    _, area_id, steps_num = header
+    pos += 12
+
+    # Step: 이름, 기본값(dword), 변수명 10개
+    for _ in range(steps_num):
+        pos = _scan_strings(buf, pos, 1, spans)
+        ints.append(unpack(buf, pos)[0])
+        pos += 4
+        if buf[pos:pos + _STEP_EMPTY_NAMES_SIZE] == _STEP_EMPTY_NAMES:
+            # 변수명 10개가 모두 빈 문자열 (대부분의 Step): 길이 필드 40바이트를 한 번에 비교
+            spans.extend(_STEP_EMPTY_SPANS)
+            pos += _STEP_EMPTY_NAMES_SIZE
+        else:
+            pos = _scan_strings(buf, pos, 10, spans)
+
+    flags_num = unpack(buf, pos)[0]
+    ints.append(flags_num)
+    pos += 4
 
-class Flag:
-    def __init__(self, parent: SummaryFileReader, f: "CWFile"):
-        self.name = f.string()
-        self.default = f.boolean()
-        self.variable_names = [f.string() for _ in range(2)]
+    # Flag: 이름, 기본값(byte, 0이 아니면 True), 변수명 2개
+    for _ in range(flags_num):
+        pos = _scan_strings(buf, pos, 1, spans)
+        ints.append(buf[pos])
+        pos = _scan_strings(buf, pos + 1, 2, spans)
+
+    if area_id > 19999:
+        # 불명 데이터 뒤에 레벨 min/max
+        ints.extend(_S_DWORD3_FROM(buf, pos)[1:])
+    else:
+        unpack(buf, pos)  # 불명 데이터 (값은 쓰지 않지만 잘린 파일은 여기서 오류)
+
+    return ints, spans
 
 
 # ------------------------------------------------------------------------------
@@ -256,15 +487,25 @@ class Flag:
 
 
 # 한글, 히라가나, 가타카나 유니코드 범위
-hangul_regex = re.compile(r'[\uAC00-\uD7AF]')
-hiragana_regex = re.compile(r'[\u3040-\u309F]')
-katakana_regex = re.compile(r'[\u30A0-\u30FF]')
+# 판별에 쓰지 않는 문자를 한 번에 걷어내고, 남은 짧은 문자열에서 길이 차이로 개수를 센다
+_non_target_regex = re.compile(r'[^\uAC00-\uD7AF\u3040-\u30FF]+')
+_hangul_run_regex = re.compile(r'[\uAC00-\uD7AF]+')
+_hiragana_run_regex = re.compile(r'[\u3040-\u309F]+')
 
 def detect_language(text):
-    # 문자 세트별 빈도 계산
-    hangul_count = len(hangul_regex.findall(text))
-    hiragana_count = len(hiragana_regex.findall(text))
-    katakana_count = len(katakana_regex.findall(text))
+    # ASCII만으로 된 문자열은 내부 플래그만 확인하므로 스캔 없이 바로 판별 불가
+    if text.isascii():
+        return None
+    # 문자 세트별 빈도 계산 (findall처럼 문자마다 객체를 만들지 않음)
+    kept = _non_target_regex.sub('', text)
+    if not kept:
+        # 한글/가나가 하나도 없으면 나머지 두 번의 치환은 생략
+        return None
+    kana = _hangul_run_regex.sub('', kept)
+    katakana = _hiragana_run_regex.sub('', kana)
+    hangul_count = len(kept) - len(kana)
+    hiragana_count = len(kana) - len(katakana)
+    katakana_count = len(katakana)
     
     # 판별 로직
     if hangul_count > (hiragana_count + katakana_count):
@@ -274,15 +515,29 @@ def detect_language(text):
     else:
         return None
 
-def read_with_encoding(file, file_path):
-    raw_data = file.read()
+# XML 선언의 encoding 속성 (바이트에서 바로 검색)
+_ENCODING_RE = re.compile(rb'encoding="([^"]+)"')
+
+# 스캔 대상 확장자
+SCENARIO_EXTENSIONS = ('.wsn', '.wsm')
+# ZIP 안에서 찾을 요약 파일
+SUMMARY_TARGETS = ('summary.xml', 'summary.wsm')
 
+@functools.lru_cache(maxsize=32)
+def _codec_name(encoding: str) -> str:
+    """인코딩 이름을 코덱의 정식 이름으로 정규화 (예: 'MS932', 'CP932' -> 'cp932')"""
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return encoding.lower()
+
+def decode_xml_bytes(raw_data: bytes) -> str:
+    """XML 선언의 인코딩(없으면 UTF-8) → CP932 → UTF-8(무시) 순으로 디코딩"""
     # XML 헤더에서 인코딩 추출
-    header_text = raw_data[:100].decode("ascii", errors="ignore")  # ASCII로 인코딩 정보 추출
-    encoding_match = re.search(r'encoding="([^"]+)"', header_text)
+    encoding_match = _ENCODING_RE.search(raw_data, 0, 100)
     
     if encoding_match:
-        encoding = encoding_match.group(1)
+        encoding = encoding_match.group(1).decode("ascii", errors="ignore")
     else:
         encoding = "utf-8"  # 기본 인코딩
 
@@ -291,44 +546,273 @@ def read_with_encoding(file, file_path):
         decoded_text = raw_data.decode(encoding)
         return decoded_text
     except UnicodeDecodeError as e:
+        # 선언된 인코딩이 이미 CP932(별칭 포함)였다면 같은 디코딩을 반복하지 않음
+        if _codec_name(encoding) != "cp932":
+            try:
+                decoded_text = raw_data.decode("CP932")
+                return decoded_text
+            except UnicodeDecodeError as e_cp932:
+                pass
+        return raw_data.decode("utf-8", errors="ignore")  # 최종 대체
+
+
+def _walk_files(folder_path):
+    """폴더를 재귀적으로 순회하며 파일 DirEntry를 반환 (심볼릭 링크 폴더는 따라가지 않음)"""
+    try:
+        with os.scandir(folder_path) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.warning(f"폴더를 읽을 수 없습니다: {folder_path} ({e})")
+        return
+
+    subdirs = []
+    for entry in entries:
         try:
-            decoded_text = raw_data.decode("CP932")
-            return decoded_text
-        except UnicodeDecodeError as e_cp932:
-            return raw_data.decode("utf-8", errors="ignore")  # 최종 대체
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+        except OSError:
+            continue
+        yield entry
 
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
 
-def find_files_with_content(folder_path):
-    """폴더 내 모든 파일을 스캔하고 ZIP 파일의 특정 내용 추출"""
-    files = []
-    zip_files = []
+def _collect_scan_targets(folder_path):
+    """
+    폴더를 순회하며 스캔 대상(WSN/WSM 파일과 ZIP 파일)의 (경로, stat) 목록을 수집
+    stat은 순회 중 DirEntry에서 한 번만 얻어 캐시 확인과 수정 시간에 함께 사용합니다.
+    """
+    scenario_paths = []
+    zip_paths = []
+
+    for entry in _walk_files(folder_path):
+        ext = os.path.splitext(entry.name)[1].lower()
+        if ext == ".zip":
+            targets = zip_paths  # ZIP 파일 필터링
+        elif ext in SCENARIO_EXTENSIONS:
+            targets = scenario_paths  # WSN 또는 WSM 파일
+        else:
+            continue
 
-    for dirpath, _, filenames in os.walk(folder_path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename).replace("\\", "/")
+        try:
+            stat = entry.stat()
+        except OSError as e:
+            logger.warning(f"파일 정보를 읽을 수 없어 건너뜁니다: {entry.path} ({e})")
+            continue
+        targets.append((entry.path.replace("\\", "/"), stat))
 
-            # ZIP 파일 필터링
-            if filename.lower().endswith(".zip"):
-                zip_files.append(file_path)
+    return scenario_paths, zip_paths
+
+def _scan_chunk(chunk):
+    """
+    스캔 대상 묶음을 처리하여 입력 순서대로 결과 리스트를 반환 (chunk: [(경로, ZIP 여부, 수정 시간)])
+    ZIP은 _iter_zip_summaries로 읽기/압축 해제와 파싱을 겹쳐서 처리합니다.
+    """
+    results = [None] * len(chunk)
+    zip_indices = [i for i, (_, is_zip, _) in enumerate(chunk) if is_zip]
+    zip_summaries = _iter_zip_summaries([chunk[i][0] for i in zip_indices]) if zip_indices else iter(())
+
+    for i, (path, is_zip, modification_time) in enumerate(chunk):
+        if not is_zip:
+            results[i] = extract_info_from_scenario(path, modification_time=modification_time)
+
+    for i, (zip_path, summary) in zip(zip_indices, zip_summaries):
+        if isinstance(summary, Exception):
+            raise summary
+        results[i] = _parse_zip_summary(zip_path, summary)
+    return results
+
+# 한 묶음에 넣을 최대 스캔 대상 수
+_SCAN_MAX_CHUNKSIZE = 16
+# 스캔 대상이 이보다 적으면 (캐시로 대부분 건너뛴 재스캔 등) 풀을 띄우지 않고 바로 처리
+_SCAN_POOL_MIN_TARGETS = 16
+
+def _map_scan_targets(targets, chunksize=None):
+    """
+    스캔 대상을 chunksize개씩 묶어 프로세스 풀에서 병렬 처리하고 입력 순서대로 결과를 반환합니다.
+    ZIP 해제와 XML/WSM 파싱은 CPU 작업이라 GIL에 묶이지 않도록 프로세스로 나누고,
+    프로세스를 띄울 수 없는 환경이면 남은 대상을 스레드 풀로 이어서 처리합니다.
+    chunksize를 생략하면 워커마다 4묶음 정도가 돌아가도록 정합니다 (최대 _SCAN_MAX_CHUNKSIZE).
+    """
+    if len(targets) < _SCAN_POOL_MIN_TARGETS:
+        # 프로세스 기동 비용이 파싱 시간보다 크므로 현재 스레드에서 처리
+        yield from _scan_chunk(targets)
+        return
+
+    workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, min(_SCAN_MAX_CHUNKSIZE, -(-len(targets) // (workers * 4))))
+    chunks = [targets[i:i + chunksize] for i in range(0, len(targets), chunksize)]
+    workers = min(workers, len(chunks))
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(_scan_chunk, chunks):
+                done += 1
+                yield from results
+        return
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"프로세스 풀을 사용할 수 없어 스레드 풀로 전환합니다: {e}")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(_scan_chunk, chunks[done:]):
+            yield from results
+
+# 스캔 결과 캐시 파일 이름 (메인 DB와 같은 폴더에 둠, scan_cache_path() 참고)
+SCAN_CACHE_FILENAME = "scan_cache.db"
+# 스캔 결과 형식/추출 로직 버전. 추출 결과가 달라지는 변경을 하면 반드시 올릴 것
+# (PRAGMA user_version과 다르면 캐시 전체를 버리고 다시 스캔)
+SCAN_CACHE_VERSION = 1
+
+def scan_cache_path(db_path: str) -> str:
+    """메인 DB 파일 경로로부터 같은 폴더의 스캔 캐시 경로를 만듦"""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), SCAN_CACHE_FILENAME)
+
+class ScanCache:
+    """
+    파일별 스캔 결과 캐시. (경로, 크기, 수정 시각(ns))이 그대로면 파일을 다시 파싱하지 않습니다.
+    결과가 없는 ZIP(대상 파일 없음)도 None으로 저장해 다음 스캔에서 다시 열지 않습니다.
+    SCAN_CACHE_VERSION이 바뀌면 기존 항목을 모두 버립니다.
+    """
+    COMMIT_INTERVAL = 100
+
+    def __init__(self, db_name: str) -> None:
+        self.conn = sqlite3.connect(db_name)
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCAN_CACHE_VERSION:
+            if version:
+                logger.info(f"스캔 캐시 버전이 달라 캐시를 비웁니다: {version} -> {SCAN_CACHE_VERSION}")
+            self.conn.execute("DROP TABLE IF EXISTS scan_cache")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scan_cache (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                data BLOB
+            )
+        """)
+        self.conn.execute(f"PRAGMA user_version = {SCAN_CACHE_VERSION:d}")
+        self.conn.commit()
+        self._pending = 0
+
+    def lookup(self, path: str, size: int, mtime_ns: int):
+        """캐시 적중 여부와 저장된 결과를 (hit, data)로 반환"""
+        row = self.conn.execute(
+            "SELECT data FROM scan_cache WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, size, mtime_ns)
+        ).fetchone()
+        if row is None:
+            return False, None
+        try:
+            return True, pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"스캔 캐시 항목을 읽을 수 없습니다: {path} ({e})")
+            return False, None
+
+    def store(self, path: str, size: int, mtime_ns: int, data) -> None:
+        """스캔 결과 저장 (COMMIT_INTERVAL건마다 커밋)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO scan_cache (path, size, mtime_ns, data) VALUES (?, ?, ?, ?)",
+            (path, size, mtime_ns, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+        self._pending += 1
+        if self._pending >= self.COMMIT_INTERVAL:
+            self.conn.commit()
+            self._pending = 0
+
+    def prune(self, folder_path: str, seen_paths) -> None:
+        """폴더 하위 항목 중 이번 순회에서 보이지 않은 경로(이동/삭제된 파일)를 삭제"""
+        # '/' 다음 문자가 '0'이므로 [folder/, folder0) 범위가 폴더 하위 경로 전체와 일치
+        folder = folder_path.replace("\\", "/").rstrip("/")
+        rows = self.conn.execute(
+            "SELECT path FROM scan_cache WHERE path >= ? AND path < ?", (folder + "/", folder + "0")
+        ).fetchall()
+        stale = [row for row in rows if row[0] not in seen_paths]
+        if stale:
+            self.conn.executemany("DELETE FROM scan_cache WHERE path = ?", stale)
+            logger.info(f"스캔 캐시에서 사라진 파일 {len(stale)}건을 삭제했습니다.")
+
+    def close(self) -> None:
+        try:
+            self.conn.commit()
+        finally:
+            self.conn.close()
+
+def _open_scan_cache(cache_path):
+    """스캔 캐시를 열고, 경로가 없거나 열 수 없으면 None (캐시 없이 스캔)"""
+    if not cache_path:
+        return None
+    try:
+        return ScanCache(cache_path)
+    except sqlite3.Error as e:
+        logger.warning(f"스캔 캐시를 열 수 없어 캐시 없이 스캔합니다: {e}")
+        return None
+
+def _scan_targets_with_cache(targets, stats, cache):
+    """캐시에 있는 대상은 바로 반환하고, 나머지만 병렬로 스캔한 뒤 캐시에 저장"""
+    misses = []
+    for target, stat in zip(targets, stats):
+        if cache is not None:
+            hit, extracted_info = cache.lookup(target[0], stat.st_size, stat.st_mtime_ns)
+            if hit:
+                yield extracted_info
+                continue
+        misses.append((target, stat))
+
+    scanned = _map_scan_targets([target for target, _ in misses])
+    for (target, stat), extracted_info in zip(misses, scanned):
+        if cache is not None:
+            cache.store(target[0], stat.st_size, stat.st_mtime_ns, extracted_info)
+        yield extracted_info
+
+def iter_files_with_content(folder_path, batch_size=500, cache_path=None):
+    """
+    폴더 내 모든 파일을 프로세스 풀에서 스캔하고, 결과를 batch_size 단위 리스트로 순차 반환합니다.
+    소비자(DB 쓰기)가 배치를 처리하는 동안에도 나머지 파일 스캔은 계속 진행됩니다.
+    cache_path를 주면 크기와 수정 시각이 바뀌지 않은 파일은 스캔 캐시의 결과를 그대로 사용합니다.
+    """
+    scenario_paths, zip_paths = _collect_scan_targets(folder_path)
+    targets = [(path, False, stat.st_mtime) for path, stat in scenario_paths]
+    targets += [(path, True, stat.st_mtime) for path, stat in zip_paths]
+    stats = [stat for _, stat in scenario_paths + zip_paths]
+
+    cache = _open_scan_cache(cache_path)
+    try:
+        batch = []
+        for extracted_info in _scan_targets_with_cache(targets, stats, cache):
+            if not extracted_info:
                 continue
+            batch.append(extracted_info)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
 
-            # WSN 또는 WSM 파일 처리
-            if filename.lower().endswith((".wsn", ".wsm")):
-                extracted_info = extract_info_from_scenario(file_path)
-                if extracted_info:
-                    files.append(extracted_info)
+        if batch:
+            yield batch
 
-    # ZIP 파일 처리
-    for zip_path in zip_files:
-        extracted_info = process_zip_file(zip_path)
-        if extracted_info:
-            files.append(extracted_info)
+        # 순회를 끝까지 마친 경우에만 사라진 파일의 캐시 항목 정리
+        if cache is not None:
+            cache.prune(folder_path, {target[0] for target in targets})
+    finally:
+        if cache is not None:
+            cache.close()
 
+def find_files_with_content(folder_path):
+    """폴더 내 모든 파일을 스캔하고 ZIP 파일의 특정 내용 추출"""
+    files = [file_data for batch in iter_files_with_content(folder_path) for file_data in batch]
     logger.info(f"Total number of scanned files: {len(files)}")
     return files
 
-def extract_info_from_scenario(file_path, file_name=None, zip_path=None, is_zip=False, zip_handler=None):
-    """WSN, WSM 파일에서 정보를 추출 (ZIP 내부 포함)"""
+def _zip_entry_stream(zip_file):
+    """ZIP 내부 파일 스트림을 CWFile에 넘길 수 있는 형태로 반환 (seek 불가면 큰 버퍼로 감쌈)"""
+    if zip_file.seekable():
+        return zip_file
+    return io.BufferedReader(zip_file, buffer_size=1 << 20)
+
+def extract_info_from_scenario(file_path, file_name=None, zip_path=None, is_zip=False, zip_handler=None,
+                               modification_time=None):
+    """WSN, WSM 파일에서 정보를 추출 (ZIP 내부 포함, modification_time을 주면 stat 생략)"""
     extracted_info = {}
 
     # 실제 파일 경로 생성
@@ -340,22 +824,24 @@ def extract_info_from_scenario(file_path, file_name=None, zip_path=None, is_zip=
     else:
         decoded_file_name = file_name or file_path
 
-    # 확장자 확인
-    is_wsn = decoded_file_name.lower().endswith('.wsn') if decoded_file_name else file_path.lower().endswith('.wsn')
-    is_wsm = decoded_file_name.lower().endswith('.wsm') if decoded_file_name else file_path.lower().endswith('.wsm')
+    # 확장자 확인 (한 번만 소문자로 변환)
+    ext = os.path.splitext(decoded_file_name)[1].lower()
+    is_wsn = ext == '.wsn'
+    is_wsm = ext == '.wsm'
 
     # WSN 파일 처리
     if is_wsn and not is_zip:
         try:
-            with zipfile.ZipFile(file_path, 'r') as wsn_zip:
-                with JapaneseZipHandler(file_path) as handler:
-                    summary_file_name = next(
-                        (name for name in wsn_zip.namelist() if name.lower().endswith('summary.xml')),
-                        None
-                    )
+            # ZIP은 한 번만 열고 (중앙 디렉터리도 한 번만 읽음) 같은 핸들로 Summary.xml을 읽음
+            with JapaneseZipHandler(file_path) as handler:
+                wsn_zip = handler._zip_ref
+                summary_file_name = next(
+                    (name for name in wsn_zip.namelist() if name.lower().endswith('summary.xml')),
+                    None
+                )
                 if summary_file_name:
                     with wsn_zip.open(summary_file_name) as summary_file:
-                        xml_data = read_with_encoding(summary_file, summary_file_name)
+                        xml_data = summary_file.read()
                     extracted_info = parse_xml_data(xml_data)
 
                 extracted_info['Version'] = 'Py'
@@ -371,16 +857,24 @@ def extract_info_from_scenario(file_path, file_name=None, zip_path=None, is_zip=
     # WSM 파일 처리 (ZIP 내부 또는 외부)
     elif is_wsm:
         try:
-            if not isinstance(file_path, str):
-                # ZIP 내부의 WSM 파일
-                raw_data = file_path.read()
-                f = CWFile(None, 'rb', f=io.BytesIO(raw_data))
+            opened = None
+            if isinstance(file_path, CWFile):
+                # 이미 메모리에 읽어 둔 ZIP 내부 WSM (BytesCWFile)
+                f = file_path
+            elif not isinstance(file_path, str):
+                # ZIP 내부의 WSM 파일 (메모리로 복사하지 않고 스트림을 그대로 사용)
+                f = CWFile(None, 'rb', f=_zip_entry_stream(file_path))
             else:
-                # 일반 WSM 파일
-                f = CWFile(file_path, 'rb')
-
-            reader = SummaryFileReader(f, file_path)
-            extracted_data = reader.read_summary_data()
+                # 일반 WSM 파일 (작은 파일은 풀 버퍼에 통째로 읽어 오프셋 커서로 파싱)
+                # 이미지는 건너뛰고 문자열은 모두 디코딩되므로 close() 뒤에 버퍼를 참조하는 값이 남지 않음
+                f = opened = open_cwfile(file_path, pooled=True)
+
+            try:
+                reader = SummaryFileReader(f, file_path)
+                extracted_data = reader.read_summary_data()
+            finally:
+                if opened is not None:
+                    opened.close()
             extracted_info = dict(zip(
                 ['Name', 'Author', 'Version', 'Level min', 'Level max', 'RequiredCoupons_number', 
                  'RequiredCoupons_name', 'image_paths', 'position_types', 'image_data', 
@@ -391,15 +885,24 @@ def extract_info_from_scenario(file_path, file_name=None, zip_path=None, is_zip=
         except Exception as e:
             logger.error(f"WSM 파일 처리 중 오류 발생: {e}")
 
-    formatted_data = format_file_data(extracted_info, file_path)
+    formatted_data = format_file_data(extracted_info, file_path, modification_time=modification_time)
     return formatted_data
 
-def parse_summary_from_folder(folder_path: str, show_warning: bool = True) -> dict:
+def parse_summary_from_folder(folder_path: str, show_warning: bool = True,
+                              errors: Optional[list] = None) -> dict:
+    """
+    폴더의 Summary.xml을 읽어 extracted_info를 반환합니다.
+    errors 리스트를 넘기면 Summary.xml이 없을 때 대화상자 대신 (folder_path, "missing")을 추가하고,
+    여러 폴더를 처리한 뒤 호출 측에서 show_summary_errors()로 한 번에 알립니다.
+    """
     external_summary_path = os.path.join(folder_path, 'Summary.xml')
     
     if not os.path.isfile(external_summary_path):
-        # 경고 메시지 설정: show_warning이 True일 때는 QMessageBox, False일 때는 콘솔 출력
-        if show_warning:
+        # 경고 메시지 설정: errors가 있으면 수집, show_warning이 True일 때는 QMessageBox, False일 때는 콘솔 출력
+        if errors is not None:
+            logger.error(f"Unable to find the Summary.xml file in {folder_path}.")
+            errors.append((folder_path, "missing"))
+        elif show_warning:
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setText(f"Unable to recognize the Summary.xml file in {folder_path}.")
@@ -413,7 +916,7 @@ def parse_summary_from_folder(folder_path: str, show_warning: bool = True) -> di
 
     # Summary.xml 파일이 존재하는 경우: 데이터를 읽고 처리
     with open(external_summary_path, 'rb') as summary_file:
-        xml_data = read_with_encoding(summary_file, external_summary_path)
+        xml_data = summary_file.read()
     
     # XML 데이터 파싱 및 정보 추출
     extracted_info = parse_xml_data(xml_data)
@@ -421,6 +924,18 @@ def parse_summary_from_folder(folder_path: str, show_warning: bool = True) -> di
     extracted_info['file_path'] = folder_path  # 폴더 경로로 file_path 설정
     return extracted_info
 
+def show_summary_errors(errors: list, parent=None) -> None:
+    """parse_summary_from_folder에서 모은 오류를 대화상자 하나로 표시"""
+    if not errors:
+        return
+    msg = QMessageBox(parent)
+    msg.setIcon(QMessageBox.Warning)
+    msg.setText(f"Unable to recognize the Summary.xml file in {len(errors)} folder(s).")
+    msg.setDetailedText("\n".join(folder_path for folder_path, _ in errors))
+    msg.setWindowTitle("File Recognition Error")
+    msg.setStandardButtons(QMessageBox.Ok)
+    msg.exec_()
+
 def default_extracted_info(file_path: str) -> dict:
     """
     기본 extracted_info 값을 반환
@@ -440,39 +955,105 @@ def default_extracted_info(file_path: str) -> dict:
         'file_path': file_path
     }
 
-def parse_xml_data(xml_data: str) -> dict:
+# 디코딩된 문자열용 파서 (깨진 Summary.xml도 읽을 수 있는 부분까지 복구)
+# 문자열은 UTF-8로 다시 인코딩해 넘기므로 XML 선언의 encoding은 무시하고 UTF-8로 고정
+_XML_PARSER = etree.XMLParser(recover=True, huge_tree=False, encoding='utf-8')
+
+# 복구 모드로 읽은 루트에서 Property를 찾는 XPath (모듈 로드 시 한 번만 컴파일, find()와 같이 첫 번째 요소만 사용)
+_XP_PROPERTY = etree.XPath('Property[1]')
+
+def _first_element(xpath, element):
+    """XPath 결과의 첫 요소 (없으면 None)"""
+    result = xpath(element)
+    return result[0] if result else None
+
+def _first_children(element) -> dict:
+    """자식 요소를 한 번만 훑어 태그별 첫 번째 자식을 반환 (find()를 태그마다 반복하지 않음)"""
+    children = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+def _element_text_or(element, default):
+    """findtext()와 같이 요소가 없으면 default, 있으면 텍스트(없으면 '')를 반환"""
+    if element is None:
+        return default
+    return element.text or ''
+
+def _iter_root_property(xml_data: bytes):
+    """루트 바로 아래의 Property 요소가 닫히는 즉시 반환하고 나머지 문서는 파싱하지 않음
+
+    Property 뒤에 오는 Steps/Flags 정의는 요약 정보에 쓰이지 않으므로
+    iterparse로 필요한 부분까지만 읽는다. Property가 없으면 None.
+    """
+    for _, elem in etree.iterparse(io.BytesIO(xml_data), events=('end',), tag='Property',
+                                   huge_tree=False):
+        parent = elem.getparent()
+        if parent is not None and parent.getparent() is None:
+            return elem
+        # 루트 직속이 아닌 Property는 쓰지 않으므로 바로 비워 메모리를 아낌
+        elem.clear()
+    return None
+
+def _element_text(element) -> str:
+    """요소 아래의 텍스트만 이어 붙여 반환 (태그/속성은 제외, 요소가 없으면 빈 문자열)"""
+    return '' if element is None else ''.join(element.itertext())
+
+def _parse_xml_property(xml_data: Union[str, bytes]):
+    """
+    Summary의 Property 요소와 언어 감지에 쓸 텍스트를 반환합니다.
+    언어 감지는 문서 전체가 아니라 Property의 텍스트(이름, 작자, 설명 등)에만 적용합니다.
+    """
+    if isinstance(xml_data, bytes):
+        # 원본 바이트를 그대로 파서에 넘겨 디코딩 복사를 생략
+        try:
+            property_element = _iter_root_property(xml_data)
+        except etree.XMLSyntaxError as e:
+            # 인코딩 선언이 없거나 틀린 경우 등은 직접 디코딩 후 복구 모드로 재시도
+            logger.debug(f"XML 바이트 파싱 실패, 디코딩 후 재시도: {e}")
+            xml_data = decode_xml_bytes(xml_data)
+        else:
+            return property_element, _element_text(property_element)
+
+    root = etree.fromstring(xml_data.encode('utf-8'), _XML_PARSER)
+    if root is None:
+        raise etree.XMLSyntaxError("empty document", None, 0, 0)
+    property_element = _first_element(_XP_PROPERTY, root)
+    return property_element, _element_text(property_element)
+
+def parse_xml_data(xml_data: Union[str, bytes]) -> dict:
     extracted_info = {}
     try:
-        # language_code를 xml_data에서 감지하여 설정
-        language_code = detect_language(xml_data) or 'Unknown'
-        
-        root = ET.fromstring(xml_data)
-        property_element = root.find('Property')
+        property_element, text = _parse_xml_property(xml_data)
+
+        # language_code를 XML 텍스트에서 감지하여 설정
+        language_code = detect_language(text) or 'Unknown'
+
         if property_element is not None:
-            extracted_info['Name'] = property_element.findtext('Name', default='')
-            extracted_info['Author'] = property_element.findtext('Author', default='Unknown')
-            level_element = property_element.find('Level')
+            children = _first_children(property_element)
+            extracted_info['Name'] = _element_text_or(children.get('Name'), '')
+            extracted_info['Author'] = _element_text_or(children.get('Author'), 'Unknown')
+            level_element = children.get('Level')
             if level_element is not None:
                 extracted_info['Level max'] = level_element.get('max', '')
                 extracted_info['Level min'] = level_element.get('min', '')
             extracted_info['Version'] = 'Py'
-            description_elem = property_element.find('Description')
-            extracted_info['description'] = description_elem.text if description_elem is not None and description_elem.text else ''
+            extracted_info['description'] = _element_text_or(children.get('Description'), '')
 
             image_paths, position_types = [], []
-            image_paths_elem = property_element.find('ImagePaths')
+            image_paths_elem = children.get('ImagePaths')
             if image_paths_elem is not None:
-                for image_path_elem in image_paths_elem.findall('ImagePath'):
+                for image_path_elem in image_paths_elem.iterchildren('ImagePath'):
                     image_paths.append(image_path_elem.text)
                     position_types.append(image_path_elem.get('positiontype', ''))
-            single_image_path_elem = property_element.find('ImagePath')
+            single_image_path_elem = children.get('ImagePath')
             if single_image_path_elem is not None:
                 image_paths.append(single_image_path_elem.text)
                 position_types.append(single_image_path_elem.get('positiontype', ''))
             extracted_info['image_paths'] = image_paths
             extracted_info['position_types'] = position_types
 
-            required_coupons_elem = property_element.find('RequiredCoupons')
+            required_coupons_elem = children.get('RequiredCoupons')
             if required_coupons_elem is not None:
                 coupon_name = required_coupons_elem.text.strip() if required_coupons_elem.text else ''
                 extracted_info['RequiredCoupons'] = {
@@ -484,20 +1065,27 @@ def parse_xml_data(xml_data: str) -> dict:
 
         extracted_info['language_code'] = language_code
 
-    except ET.ParseError as parse_error:
+    except etree.XMLSyntaxError as parse_error:
         logger.error(f"XML 파싱 실패: {parse_error}")
     
     return extracted_info
 
-def process_zip_file(zip_path):
-    """향상된 ZIP 파일 처리 함수 (summary.xml 또는 summary.wsm만 추출)"""
+def _read_zip_summary(zip_path):
+    """
+    ZIP에서 처음으로 열 수 있는 summary.xml 또는 summary.wsm을 찾아 (디코딩된 이름, 원본 바이트)를 반환합니다.
+    (I/O와 압축 해제 단계, 대상이 없거나 열 수 없으면 None)
+    """
     try:
         with JapaneseZipHandler(zip_path) as zip_handler:
             # ZIP 내부 파일 중 summary.xml 또는 summary.wsm만 추출
-            target_files = [
-                (orig, decoded) for orig, decoded in zip_handler.list_contents()
-                if decoded.lower().endswith(('summary.xml', 'summary.wsm'))
-            ]
+            # ('summary.'는 ASCII라 원래 이름에도 그대로 있으므로, 먼저 부분 문자열로 거른 뒤에만 디코딩)
+            target_files = []
+            for orig in zip_handler._zip_ref.namelist():
+                if 'summary.' not in orig.lower():
+                    continue
+                decoded = zip_handler.get_real_filename(orig)
+                if decoded.lower().endswith(SUMMARY_TARGETS):
+                    target_files.append((orig, decoded))
 
             if not target_files:
                 logger.debug(f"No target files found in {zip_path}")
@@ -508,7 +1096,7 @@ def process_zip_file(zip_path):
                 try:
                     # 암호화된 파일인지 확인 및 처리
                     with zip_handler._zip_ref.open(original_name) as summary_file:
-                        return parse_summary_from_zip(summary_file, decoded_name, zip_path)
+                        return decoded_name, summary_file.read()
                 except RuntimeError as e:
                     if "password required" in str(e).lower():
                         logger.error(f"File '{decoded_name}' is encrypted. Skipping...")
@@ -520,16 +1108,60 @@ def process_zip_file(zip_path):
         logger.error(f"Bad ZIP file: {zip_path}")
     return None
 
+def _parse_zip_summary(zip_path, summary):
+    """_read_zip_summary 결과를 파싱 (파싱 단계)"""
+    if summary is None:
+        return None
+    decoded_name, raw_data = summary
+    return parse_summary_from_zip(BytesCWFile(raw_data, decoded_name), decoded_name, zip_path)
 
+def process_zip_file(zip_path):
+    """향상된 ZIP 파일 처리 함수 (summary.xml 또는 summary.wsm만 추출)"""
+    return _parse_zip_summary(zip_path, _read_zip_summary(zip_path))
 
-def format_file_data(extracted_info, file_path, zip_path=None):
-    """extracted_info 데이터를 일관된 형식으로 변환"""
-    if isinstance(file_path, str):
-        modification_time = os.path.getmtime(file_path)
-    elif zip_path and isinstance(zip_path, str):
-        modification_time = os.path.getmtime(zip_path)  # ZIP 파일의 수정 시간 사용
-    else:
-        modification_time = None  # 수정 시간을 알 수 없는 경우 None
+def _iter_zip_summaries(zip_paths, depth=4):
+    """
+    별도 스레드가 ZIP 요약 파일을 미리 읽어(압축 해제 중에는 GIL이 풀림) depth개까지 쌓아 두고,
+    호출 측은 앞선 ZIP을 파싱하는 동안 다음 ZIP의 읽기가 겹쳐서 진행되도록 (경로, 결과)를 순서대로 반환합니다.
+    """
+    q = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def producer():
+        try:
+            for zip_path in zip_paths:
+                try:
+                    item = (zip_path, _read_zip_summary(zip_path))
+                except Exception as e:
+                    item = (zip_path, e)
+                while not stop.is_set():
+                    try:
+                        q.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+        finally:
+            if not stop.is_set():
+                q.put(done)
+
+    threading.Thread(target=producer, daemon=True).start()
+    try:
+        while (item := q.get()) is not done:
+            yield item
+    finally:
+        stop.set()
+
+def format_file_data(extracted_info, file_path, zip_path=None, modification_time=None):
+    """extracted_info 데이터를 일관된 형식으로 변환 (modification_time이 있으면 그대로 사용)"""
+    if modification_time is None:
+        if isinstance(file_path, str):
+            modification_time = os.path.getmtime(file_path)
+        elif zip_path and isinstance(zip_path, str):
+            modification_time = os.path.getmtime(zip_path)  # ZIP 파일의 수정 시간 사용
+        # 그 외에는 수정 시간을 알 수 없으므로 None
 
     return {
         'file_path': extracted_info.get('file_path', file_path),
@@ -557,39 +1189,65 @@ def parse_summary_from_zip(summary_file, file_name, zip_path=None):
     """ZIP 내부에서 Summary.xml 또는 Summary.wsm 내용을 읽어와서 파싱"""
     try:
         summary_file.seek(0)  #  ZIP 내부 파일 스트림 포인터 초기화
-        raw_data = summary_file.read()
-
-        if not raw_data:
-            logger.error(f"Summary file {file_name} is empty.")
-            return {}
-
-        logger.debug(f"Read {len(raw_data)} bytes from {file_name}")
 
         #  XML 파일이면 XML 파싱
         if file_name.lower().endswith(".xml"):
-            summary_file.seek(0)  #  포인터 재설정 후 다시 읽기
-            xml_data = read_with_encoding(summary_file, file_name)
-            extracted_info = parse_xml_data(xml_data)  #  기존 XML 파싱 함수 활용
+            if isinstance(summary_file, BytesCWFile):
+                # lxml은 bytes만 받으므로 memoryview를 복사하지 않고 원본 bytes를 그대로 사용
+                raw_data = summary_file.getvalue()
+            else:
+                raw_data = summary_file.read()
+            if not raw_data:
+                logger.error(f"Summary file {file_name} is empty.")
+                return {}
+
+            logger.debug(f"Read {len(raw_data)} bytes from {file_name}")
+            extracted_info = parse_xml_data(raw_data)  #  원본 바이트를 그대로 파싱
         else:
-            #  WSM/WSN 파일은 extract_info_from_scenario()로 넘김
-            summary_file.seek(0)  #  포인터 초기화 후 WSM/WSN 처리
+            #  WSM/WSN 파일은 미리 읽지 않고 스트림째 extract_info_from_scenario()로 넘김
+            if not summary_file.read(1):
+                logger.error(f"Summary file {file_name} is empty.")
+                return {}
+            summary_file.seek(0)
             extracted_info = extract_info_from_scenario(summary_file, file_name, zip_path, is_zip=True)
 
         return extracted_info
 
-    except ET.ParseError as e:
+    except etree.XMLSyntaxError as e:
         logger.error(f"Error parsing {file_name}: {e}")
         return {}
 
+def _read_leading_image(f: BinaryIO) -> Optional[bytes]:
+    """WSM의 첫 필드인 이미지(dword 길이 + 바이트)만 읽음 (나머지 요약 데이터는 파싱하지 않음)"""
+    size = _S_DWORD(f.read(4))[0]
+    return f.read(size) if size else None
+
 def load_image_data(file_path):
-    """특정 WSM 파일의 image_data를 로드하여 반환합니다."""
+    """특정 WSM 파일의 image_data를 로드하여 반환합니다. (같은 파일을 다시 열면 캐시 사용)"""
+    source_path = file_path.split("!", 1)[0] if ".zip!" in file_path else file_path
+    try:
+        modification_time = os.path.getmtime(source_path)
+    except OSError as e:
+        logger.error(f"{file_path}을 찾을 수 없습니다: {e}")
+        return None
+    return _load_image_data(file_path, modification_time)
+
+@functools.lru_cache(maxsize=64)
+def _load_image_data(file_path, modification_time):
+    """load_image_data 본체 (수정 시간을 키에 포함해 파일이 바뀌면 다시 읽음)"""
     
     # ✅ ZIP 내부 파일인지 확인
     if ".zip!" in file_path:
         zip_path, inner_file = file_path.split("!", 1)
         
-        if zipfile.is_zipfile(zip_path):
-            with JapaneseZipHandler(zip_path) as zip_handler:
+        # is_zipfile()로 미리 열어 보지 않고, 한 번 열어서 실패하면 ZIP이 아닌 것으로 처리
+        zip_handler = JapaneseZipHandler(zip_path)
+        try:
+            zip_handler.__enter__()
+        except (zipfile.BadZipFile, OSError):
+            zip_handler = None
+        if zip_handler is not None:
+            with contextlib.closing(zip_handler._zip_ref):
                 # ZIP 내 모든 파일 목록을 디코딩된 이름과 함께 가져옴
                 contents = dict(zip_handler.list_contents())
                 
@@ -597,22 +1255,17 @@ def load_image_data(file_path):
                     real_file = [key for key, val in contents.items() if val == inner_file][0]
                     logger.debug(f"Extracting WSM from ZIP: {zip_path}!{real_file}")
                     with zip_handler._zip_ref.open(real_file) as wsm_file:
-                        wsm_data = io.BytesIO(wsm_file.read())  # BytesIO 변환 후 읽기
-                        with CWFile(None, 'rb', f=wsm_data) as f:
-                            reader = SummaryFileReader(f, real_file)
-                            extracted_info = reader.read_summary_data()
-                            return extracted_info[9]  # image_data 반환
+                        return _read_leading_image(wsm_file)  # image_data 반환
                 else:
                     logger.error(f"File '{inner_file}' not found in ZIP: {zip_path}")
                     logger.debug(f"Available files: {list(contents.values())}")
 
     # ✅ 일반 WSM 파일 처리
     elif file_path.endswith('.wsm'):
-        with CWFile(file_path, 'rb') as f:
-            reader = SummaryFileReader(f, file_path)
-            extracted_info = reader.read_summary_data()
-            logger.info(f"Extracted image data from {file_path}")
-            return extracted_info[9]  # image_data 반환
+        with open(file_path, 'rb') as wsm_file:
+            image_data = _read_leading_image(wsm_file)
+        logger.info(f"Extracted image data from {file_path}")
+        return image_data  # image_data 반환
 
     # ✅ WSM이 아닌 경우 오류 처리
     logger.error(f"{file_path}은 WSM 파일이 아닙니다. 이미지 데이터를 로드할 수 없습니다.")
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QDialogButtonBox, QWidget, QComboBox, QMessageBox, QTextEdit, QHeaderView, QApplication, QLineEdit, QSizePolicy, QScrollArea, QStyledItemDelegate, QHBoxLayout, QVBoxLayout, QTableView, QPushButton, QLabel, QListWidget, QDialog, QGridLayout
 from PyQt5.QtCore import QAbstractTableModel, Qt, QSize, QRect, QRegExp, QModelIndex
-from PyQt5.QtGui import QFont, QIcon, QRegExpValidator, QFontMetrics, QTextOption
+from PyQt5.QtGui import QFont, QIcon, QRegExpValidator, QFontMetrics, QTextOption, QPixmapCache
 from typing import List, Dict, Any
 from loguru import logger
 import json
@@ -8,6 +8,7 @@ import os
 import subprocess
 import traceback
 
+from database import _json_dumps, _json_loads  # orjson 우선 JSON 헬퍼 (database.py와 공유)
 from detail_viewer import ScenarioDetailViewer, CouponDetailViewer, InfoDetailViewer
 from utils_and_ui import get_icon, to_half_width
 from languages import language_settings
@@ -30,6 +31,10 @@ class IconDelegate(QStyledItemDelegate):
 
 
 class FileTableModel(QAbstractTableModel):  
+    # 열 번호 -> 장식 아이콘 이름 (아이콘은 처음 쓸 때 한 번만 만들어 모든 모델이 공유)
+    STATIC_ICON_NAMES = {8: "comp", 9: "summary", 10: "info", 11: "coupon", 12: "folder"}
+    _static_icons = {}
+
     def __init__(self, data: list, db_manager, current_language: str):
         super(FileTableModel, self).__init__()
         self._data = data
@@ -54,11 +59,118 @@ class FileTableModel(QAbstractTableModel):
             "headers.coupon",
             "headers.folder"
         ]
+        # 번역된 헤더 (처음 그릴 때 한 번 번역해 모델 수명 동안 사용)
+        self._translated_headers = None
+
+        # 행별 태그 표시 문자열 캐시 (행 번호 -> (표시 문자열, 툴팁))
+        # 편집이나 페이지 이동 때마다 모델을 새로 만들므로 모델 수명 동안만 유지하면 됨
+        self._tag_text_cache = {}
+        # 인원 제한 값 -> 표시 문자열 캐시 (값의 종류가 몇 개뿐이라 행마다 다시 계산하지 않음)
+        self._limit_text_cache = {}
+        # 언어 코드 -> 셀 글꼴 캐시 (FontRole은 보이는 모든 셀에서 다시 그릴 때마다 조회됨)
+        self._font_by_lang = {}
+        # 번역 키 -> 번역 문자열 캐시 (엔진 "OG", 플레이 시간 열처럼 몇 개의 키만 반복 조회됨)
+        self._translated_text = {}
+
+        # 레벨 표시 문자열은 행을 받을 때 한 번만 만들어 행에 저장
+        for row in self._data or ():
+            try:
+                row['_level_display'] = self._format_level(row['level_min'], row['level_max'])
+            except KeyError:
+                row['_level_display'] = None
+
+    def retranslate(self):
+        """
+        번역된 헤더와 표시 문자열 캐시를 비우고 다시 그리도록 알림
+        현재는 호출하는 곳이 없음: 언어는 초기 설정 마법사에서만 바뀌고, 모델은 페이지를 불러올 때마다 새로 만들어짐.
+        실행 중 언어 전환을 지원하게 되면 언어 변경 시점에 호출할 것.
+        """
+        self._translated_headers = None
+        self._tag_text_cache.clear()
+        self._limit_text_cache.clear()
+        self._translated_text.clear()
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.headers) - 1)
+        if self._data:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self._data) - 1, len(self.headers) - 1))
+
+    @classmethod
+    def _static_icon(cls, column):
+        icon = cls._static_icons.get(column)
+        if icon is None:
+            icon = cls._static_icons[column] = get_icon(cls.STATIC_ICON_NAMES[column])
+        return icon
+
+    @staticmethod
+    def _scaled_mark_icon(mark_image):
+        """32x32로 줄인 마크 아이콘 (원본 QPixmap의 cacheKey로 QPixmapCache에 보관해 셀마다 다시 축소하지 않음)"""
+        key = f"mark32:{mark_image.cacheKey()}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            scaled = mark_image.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, scaled)
+        return QIcon(scaled)
+
+    def _get_font(self, lang):
+        """언어별 셀 글꼴을 한 번만 만들어 공유"""
+        font = self._font_by_lang.get(lang)
+        if font is None:
+            font = QFont()
+            font.setPointSize(10)
+            font.setFamily(language_settings.get_font_for_language(lang).family())
+            self._font_by_lang[lang] = font
+        return font
+
+    def _tag_texts(self, row_index, row):
+        """태그 JSON 파싱과 번역을 행마다 한 번만 수행하고 (표시 문자열, 툴팁)을 반환"""
+        cached = self._tag_text_cache.get(row_index)
+        if cached is None:
+            try:
+                cached = self._build_tag_texts(row)
+            except (TypeError, ValueError, AttributeError) as e:
+                # 태그 값이 예상과 다른 형식이면 빈 칸으로 표시 (data()에서 예외가 올라가지 않도록)
+                logger.error(f"Error building tag text for row {row_index}: {e}")
+                cached = (None, None)
+            self._tag_text_cache[row_index] = cached
+        return cached
+
+    def _build_tag_texts(self, row):
+        tags = row.get('file_tags', [])
+        # JSON 문자열을 리스트로 변환
+        if isinstance(tags, str):
+            try:
+                tags = _json_loads(tags)
+            except json.JSONDecodeError:
+                tags = []
+        if not tags:
+            return "No tags", None
+
+        # 태그 키를 현재 언어의 번역으로 변환 (번역 딕셔너리에서 바로 조회)
+        # 사용자 정의 태그는 다른 언어의 번역이 NULL이므로 번역이 비어 있으면 태그 키를 그대로 표시
+        tag_map = self.tag_manager.translations_map
+        translated_tags = [tag_map.get(key) or key for key in tags]
+        display_text = ', '.join(translated_tags) if translated_tags else "No tags"
+
+        # HTML 형식으로 툴팁 생성 - 자동 줄바꿈 적용
+        tooltip_tags = [name for name in translated_tags if name]
+        tooltip_text = None
+        if tooltip_tags:
+            tooltip_text = "<div style='max-width: 300px; white-space: normal;'>"
+            tooltip_text += ", ".join(tooltip_tags)
+            tooltip_text += "</div>"
+        return display_text, tooltip_text
 
     def process_display_value(self, limit_value):
         """
-        DB에서 가져온 limit_value를 화면 표시용 텍스트로 변환
+        DB에서 가져온 limit_value를 화면 표시용 텍스트로 변환 (값별로 한 번만 계산)
         """
+        text = self._limit_text_cache.get(limit_value)
+        if text is None:
+            text = self._limit_text_cache[limit_value] = self._format_limit_value(limit_value)
+        return text
+
+    @staticmethod
+    def _format_limit_value(limit_value):
         limit_value = str(limit_value)
         
         if limit_value == "0":
@@ -72,144 +184,122 @@ class FileTableModel(QAbstractTableModel):
                 return f"{limit_value[:-1]}↑"  # n~ -> n↑
         return limit_value  # n 또는 n~m 그대로 반환
 
+    @staticmethod
+    def _format_level(level_min, level_max):
+        level_min = str(level_min)  # Level Min
+        level_max = str(level_max)  # Level Max
+
+        # 조건에 따라 level_text 생성
+        if (level_min == "0" and level_max == "0") or (level_min == "1" and level_max in ("10", "15")):
+            return "All"
+        elif level_min == level_max:
+            return level_min  # 레벨이 같을 경우 그 레벨을 텍스트로 사용
+        return f"{level_min}~{level_max}"  # 범위로 표시
+
+    def _translate(self, key):
+        """반복 조회되는 번역 키를 모델 수명 동안 캐시"""
+        text = self._translated_text.get(key)
+        if text is None:
+            text = self._translated_text[key] = language_settings.translate(key)
+        return text
+
     def data(self, index, role):
+        # 역할별 처리 함수로 바로 분기 (역할마다 긴 if 체인을 타지 않도록)
+        handler = self._role_handlers.get(role)
+        if handler is None or not index.isValid():
+            return None
+        row_index = index.row()
         try:
-            if index.isValid():  # 유효한 인덱스인지 확인
-                row = self._data[index.row()]  # 현재 행의 데이터를 가져옴
-                column = index.column()
-                
-                if role == Qt.FontRole:
-                    font = QFont()
-                    font.setPointSize(10)
-
-                    if column in [1, 2]:  # title과 author 열
-                        file_lang = row.get('lang')
-                        font.setFamily(language_settings.get_font_for_language(file_lang).family())
-                    else:
-                        font.setFamily(language_settings.get_font_for_language(self.current_language).family())
-                    return font
-
-                if role == Qt.DisplayRole or role == Qt.EditRole:  # 텍스트 반환
-                    column = index.column()
-                    if column == 1:
-                        return row['title']
-                    elif column == 2:
-                        return row['author']
-                    elif column == 3:
-                        version = row['version']
-                        if version == "OG":
-                            # "OG"에 대해서만 언어별 번역 적용
-                            return language_settings.translate("version.og")
-                        return version  # 나머지 값은 그대로 반환
-                    elif column == 4:
-                        level_min = str(row['level_min'])  # Level Min
-                        level_max = str(row['level_max'])  # Level Max
-                        
-                        # 조건에 따라 level_text 생성
-                        if (level_min == "0" and level_max == "0") or (level_min == "1" and level_max in ["10", "15"]):
-                            level_text = "All"
-                        elif level_min == level_max:
-                            level_text = level_min  # 레벨이 같을 경우 그 레벨을 텍스트로 사용
-                        else:
-                            level_text = f"{level_min}~{level_max}"  # 범위로 표시
-                        
-                        return level_text
-                    
-                    elif column == 5:  # 인원
-                        limit_value = row.get('limit_value', "0")  # DB 값 가져오기
-                        return self.process_display_value(limit_value)
-
-                    elif column == 6:  # 시간
-                        play_time = row.get('play_time', None)
-                        if play_time is None:  # NULL 값 처리
-                            return language_settings.translate("play_time.null")
-                        return language_settings.translate(f"play_time.{play_time}")
-                    
-                    elif column == 7:  # 태그 열
-                        # 태그 키를 현재 언어의 번역으로 변환
-                        tags = row.get('file_tags', [])
-                        # JSON 문자열을 리스트로 변환
-                        if isinstance(tags, str):
-                            try:
-                                tags = json.loads(tags)
-                            except json.JSONDecodeError:
-                                tags = []
-                        
-                        if tags:  # 태그가 존재하면
-                            translated_tags = [self.tag_manager.get_tag_display_name(tag) for tag in tags]
-                            return ', '.join(translated_tags) if translated_tags else "No tags"
-                        return "No tags"     
-
-                if role == Qt.ToolTipRole and column == 7:
-                    tags = row.get('file_tags', [])
-                    if tags:
-                        # 문자열로 저장된 태그 목록을 파싱
-                        if isinstance(tags, str):
-                            try:
-                                tags = json.loads(tags)
-                            except json.JSONDecodeError:
-                                tags = []
-                        
-                        # 모든 태그의 번역된 이름을 가져와서 툴팁으로 표시
-                        translated_tags = []
-                        for tag in tags:
-                            display_name = self.tag_manager.get_tag_display_name(tag)
-                            if display_name:
-                                translated_tags.append(display_name)
-                        
-                        # HTML 형식으로 툴팁 생성 - 자동 줄바꿈 적용
-                        if translated_tags:
-                            tooltip_text = "<div style='max-width: 300px; white-space: normal;'>"
-                            tooltip_text += ", ".join(translated_tags)
-                            tooltip_text += "</div>"
-                            return tooltip_text
-
-
-                if role == Qt.TextAlignmentRole and 3 <= column <= 7:
-                    return Qt.AlignCenter  # 텍스트를 가운데 정렬
-
-                if role == Qt.DecorationRole:
-                    if column == 0:  # Mark 열에서 아이콘을 반환
-                        # 사용자 마크 이미지 우선 로드
-                        mark_image = self.mark_manager.get_mark_image(row['mark'])
-
-                        # 이미지가 없으면 기본 마크 이미지 사용
-                        if mark_image is None or mark_image.isNull():
-                            mark_image = self.mark_manager.get_mark_image('mark00')  # 기본 마크 이미지
-
-                        # 아이콘 크기 32x32로 조정
-                        if mark_image and not mark_image.isNull():
-                            scaled_mark_image = mark_image.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            return QIcon(scaled_mark_image)  # 아이콘 반환
-                        else:
-                            return None  # 이미지가 없으면 None 반환
-
-
-                    elif column == 8:  # Comp 열
-                        is_completed = row.get('is_completed', 0)
-                        if is_completed:  # 1이면 완료 아이콘 표시
-                            comp_icon = get_icon("comp")
-                            return comp_icon
-                        return None                
-                    elif column == 9:  # Summary 열
-                        summary_icon = get_icon("summary")
-                        return summary_icon
-                    elif column == 10:  # Info 열
-                        info_icon = get_icon("info")
-                        return info_icon                
-                    elif column == 11:  # Coupon 열
-                        coupon_number = row.get('coupon_number', 0)  # coupon_number가 없으면 0을 기본값으로 사용
-                        if coupon_number > 0:  # coupon_number가 1 이상일 때만 아이콘 표시
-                            coupon_icon = get_icon("coupon")
-                            return coupon_icon
-                        return None  # coupon_number가 0이면 빈 칸 표시    
-                    elif column == 12:  # folder 열
-                        folder_icon = get_icon("folder")
-                        return folder_icon                              
-                return None
-        except Exception as e:
+            row = self._data[row_index]  # 현재 행의 데이터를 가져옴
+        except (IndexError, TypeError) as e:
             logger.error(f"Error in data method: {e}")
             return None
+        return handler(self, row_index, row, index.column())
+
+    def _font_data(self, row_index, row, column):
+        if column == 1 or column == 2:  # title과 author 열
+            return self._get_font(row.get('lang'))
+        return self._get_font(self.current_language)
+
+    def _display_data(self, row_index, row, column):
+        """텍스트 반환 (DisplayRole / EditRole)"""
+        if column == 1:
+            return row.get('title')
+        elif column == 2:
+            return row.get('author')
+        elif column == 3:
+            version = row.get('version')
+            if version == "OG":
+                # "OG"에 대해서만 언어별 번역 적용
+                return self._translate("version.og")
+            return version  # 나머지 값은 그대로 반환
+        elif column == 4:  # 모델 생성 때 계산해 둔 레벨 문자열
+            return row.get('_level_display')
+
+        elif column == 5:  # 인원
+            return self.process_display_value(row.get('limit_value', "0"))  # DB 값 가져오기
+
+        elif column == 6:  # 시간
+            play_time = row.get('play_time', None)
+            if play_time is None:  # NULL 값 처리
+                return self._translate("play_time.null")
+            return self._translate(f"play_time.{play_time}")
+
+        elif column == 7:  # 태그 열 (행마다 한 번만 파싱/번역한 결과 사용)
+            return self._tag_texts(row_index, row)[0]
+        return None
+
+    def _tooltip_data(self, row_index, row, column):
+        if column == 7:
+            return self._tag_texts(row_index, row)[1]
+        return None
+
+    def _alignment_data(self, row_index, row, column):
+        if 3 <= column <= 7:
+            return Qt.AlignCenter  # 텍스트를 가운데 정렬
+        return None
+
+    def _decoration_data(self, row_index, row, column):
+        if column == 0:  # Mark 열에서 아이콘을 반환
+            get_mark_image = self.mark_manager.get_mark_image
+            try:
+                # 사용자 마크 이미지 우선 로드
+                mark_image = get_mark_image(row.get('mark'))
+
+                # 이미지가 없으면 기본 마크 이미지 사용
+                if mark_image is None or mark_image.isNull():
+                    mark_image = get_mark_image('mark00')  # 기본 마크 이미지
+            except Exception as e:
+                logger.error(f"Error in data method: {e}")
+                return None
+
+            # 아이콘 크기 32x32로 조정
+            if mark_image and not mark_image.isNull():
+                return self._scaled_mark_icon(mark_image)  # 아이콘 반환
+            return None  # 이미지가 없으면 None 반환
+
+        elif column == 8:  # Comp 열
+            if row.get('is_completed', 0):  # 1이면 완료 아이콘 표시
+                return self._static_icon(column)
+            return None
+        elif column == 9 or column == 10 or column == 12:  # Summary, Info, folder 열
+            return self._static_icon(column)
+        elif column == 11:  # Coupon 열
+            coupon_number = row.get('coupon_number', 0) or 0  # coupon_number가 없으면 0을 기본값으로 사용
+            if coupon_number > 0:  # coupon_number가 1 이상일 때만 아이콘 표시
+                return self._static_icon(column)
+            return None  # coupon_number가 0이면 빈 칸 표시
+        return None
+
+    # 역할 -> 처리 함수 (data()에서 사용)
+    _role_handlers = {
+        Qt.FontRole: _font_data,
+        Qt.DisplayRole: _display_data,
+        Qt.EditRole: _display_data,
+        Qt.ToolTipRole: _tooltip_data,
+        Qt.TextAlignmentRole: _alignment_data,
+        Qt.DecorationRole: _decoration_data,
+    }
 
 
     def rowCount(self, index):
@@ -219,10 +309,12 @@ class FileTableModel(QAbstractTableModel):
         return len(self.headers) if self.headers else 0
 
     def headerData(self, section, orientation, role):
-        """ 동적으로 헤더를 번역하여 반환"""
+        """ 동적으로 헤더를 번역하여 반환 (번역은 한 번만 하고 다시 그릴 때는 캐시 사용)"""
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
             if 0 <= section < len(self.headers):
-                return language_settings.translate(self.headers[section])  # ✅ 실행 시 번역 적용
+                if self._translated_headers is None:
+                    self._translated_headers = [language_settings.translate(h) for h in self.headers]
+                return self._translated_headers[section]
         return None
 
 # QFlowLayout 구현: 자동 줄바꿈이 가능한 레이아웃에 간격 추가
@@ -232,13 +324,29 @@ class QFlowLayout(QVBoxLayout):
         self.items = []
         self.h_spacing = h_spacing
         self.v_spacing = v_spacing
+        # 위젯 추가/제거 때마다 증가 (배치 캐시 무효화용)
+        self._items_dirty_stamp = 0
+        # 마지막 배치 결과: (키, rect, [(위젯, QRect), ...])
+        self._layout_cache = None
+        # 마지막 sizeHint 결과: (스탬프, QSize)
+        self._size_hint_cache = None
 
     def addWidget(self, widget):
         self.items.append(widget)
+        self._items_dirty_stamp += 1
         super().addWidget(widget)
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
+        key = (rect.width(), len(self.items), self._items_dirty_stamp)
+        cache = self._layout_cache
+        if cache is not None and cache[0] == key and cache[1] == rect:
+            # 폭과 위젯 구성이 그대로면 sizeHint()를 다시 묻지 않고 이전 배치를 그대로 적용
+            for item, geometry in cache[2]:
+                item.setGeometry(geometry)
+            return
+
+        geometries = []
         x, y = 0, 0
         rowHeight = 0
         for item in self.items:
@@ -251,19 +359,37 @@ class QFlowLayout(QVBoxLayout):
                 y += rowHeight + self.v_spacing
                 rowHeight = 0
             # 위젯 위치 설정
-            item.setGeometry(QRect(x, y, itemSize.width(), itemSize.height()))
+            geometry = QRect(x, y, itemSize.width(), itemSize.height())
+            item.setGeometry(geometry)
+            geometries.append((item, geometry))
             x += itemSize.width() + self.h_spacing  # 수평 간격 추가
             rowHeight = max(rowHeight, itemSize.height())
+        self._layout_cache = (key, QRect(rect), geometries)
 
     def sizeHint(self):
-        valid_items = [item for item in self.items if item]
-        width = sum(item.sizeHint().width() + self.h_spacing for item in valid_items) // max(1, len(valid_items))
-        height = sum(item.sizeHint().height() + self.v_spacing for item in valid_items) // max(1, len(valid_items))
-        return QSize(width, height)
+        cache = self._size_hint_cache
+        if cache is not None and cache[0] == self._items_dirty_stamp:
+            return QSize(cache[1])
+
+        # 위젯 크기를 한 번만 훑어 평균 폭/높이 계산
+        total_width = total_height = count = 0
+        for item in self.items:
+            if not item:
+                continue
+            size = item.sizeHint()
+            total_width += size.width() + self.h_spacing
+            total_height += size.height() + self.v_spacing
+            count += 1
+        width = total_width // max(1, count)
+        height = total_height // max(1, count)
+        size = QSize(width, height)
+        self._size_hint_cache = (self._items_dirty_stamp, size)
+        return QSize(size)
 
     def removeWidget(self, widget):
         if widget in self.items:
             self.items.remove(widget)
+            self._items_dirty_stamp += 1
         super().removeWidget(widget)
 
 class TagSelector(QDialog):
@@ -288,6 +414,10 @@ class TagSelector(QDialog):
         self.tag_selector = QListWidget(self)
         self.tag_selector.setFixedWidth(120)
         self.all_tags = all_tags  # 필터링에 사용할 태그 전체 목록 저장
+        # 번역 -> 태그 키 (클릭할 때마다 전체 목록을 다시 가져와 찾지 않도록 한 번만 만듦)
+        self._name_to_key = {}
+        for tag, translation in all_tags:
+            self._name_to_key.setdefault(translation, tag)
         for tag, translation in all_tags:
             self.tag_selector.addItem(translation)
         self.tag_selector.itemClicked.connect(lambda item: self.on_tag_clicked(item))
@@ -370,13 +500,8 @@ class TagSelector(QDialog):
 
     def on_tag_clicked(self, item):
         """태그 목록에서 항목을 클릭할 때 호출되는 메소드."""
-        tag_name = item.text()
-
-        # 태그 키와 번역 쌍을 가져옴
-        tag_translations = self.parent().db.tag_manager.fetch_tag_keys_with_translations()
-
         # 태그 이름으로 태그 키 찾기
-        tag_key = next((key for key, translation in tag_translations if translation == tag_name), None)
+        tag_key = self._name_to_key.get(item.text())
 
         if tag_key:
             self.add_tag(tag_key)
@@ -391,7 +516,7 @@ class TagSelector(QDialog):
             self.parent().db.tag_manager.update_tags_for_file(file_path, selected_tags)
 
             # ✅ UI 즉시 갱신
-            self.parent().update_ui_after_edit(file_path, "file_tags", json.dumps(selected_tags))
+            self.parent().update_ui_after_edit(file_path, "file_tags", _json_dumps(selected_tags))
 
         self.accept()
 
@@ -580,6 +705,7 @@ class FileViewer(QWidget):
         self.file_data = []  # 현재 표시 중인 파일 데이터
         self.table_model = None  # 테이블 모델 초기화
         self.current_sort_field = "modification_time"
+        self._page_cursors = {}  # 페이지 번호 -> 이전 페이지 마지막 행의 (정렬 값, file_path)
 
         self.db = db_manager
         self.mark_manager = self.db.mark_manager
@@ -732,7 +858,7 @@ class FileViewer(QWidget):
             # 문자열로 저장된 태그를 리스트로 변환
             if isinstance(current_tags, str):
                 try:
-                    current_tags = json.loads(current_tags)
+                    current_tags = _json_loads(current_tags)
                 except json.JSONDecodeError:
                     current_tags = []
                     
@@ -859,7 +985,7 @@ class FileViewer(QWidget):
         # image_paths가 문자열일 경우 JSON 형식으로 파싱하여 리스트로 변환
         if isinstance(image_paths, str):
             try:
-                image_paths = json.loads(image_paths)
+                image_paths = _json_loads(image_paths)
             except json.JSONDecodeError:
                 logger.error("Error: Invalid JSON format for image_paths")
                 image_paths = []
@@ -874,8 +1000,12 @@ class FileViewer(QWidget):
         viewer = ScenarioDetailViewer(file_path, level_min, level_max, title, description, absolute_image_paths, position_types, lang)
         viewer.show_details()
 
-    def load_file_list(self):
+    def load_file_list(self, keep_cursors: bool = False):
         logger.info(f"Loading data from page {self.current_page} / Total pages: {self.total_pages}")
+
+        # 데이터/정렬/폴더가 바뀌었을 수 있으므로 페이지 이동이 아니면 키셋 커서를 초기화
+        if not keep_cursors:
+            self._page_cursors.clear()
         
         # 페이지네이션 계산
         self.calculate_total_files_and_pages()
@@ -936,20 +1066,19 @@ class FileViewer(QWidget):
         logger.debug(f"sort_field: {sort_field}")
         start_index = (page - 1) * self.page_size
 
-        query = f"""
-            SELECT * FROM file_data
-            WHERE folder_path LIKE ?
-            ORDER BY {sort_field}
-            LIMIT ? OFFSET ?
-        """
         try:
+            # 순차 이동으로 이전 페이지의 마지막 키를 알고 있으면 키셋 방식으로 조회
             result = self.db.fetch_sorted_file_data(
                 folder_path=self.scenario_folder_path,
                 sort_field=sort_field,
                 page_size=self.page_size,
                 start_index=start_index,
+                cursor_key=self._page_cursors.get(page),
             )
             logger.info(f"Rows fetched for page {page}: {len(result)}")
+            if result:
+                last_row = result[-1]
+                self._page_cursors[page + 1] = (last_row.get(sort_field), last_row["file_path"])
             return result
         except Exception as e:
             logger.error(f"Error loading data from database: {e}")
@@ -986,22 +1115,21 @@ class FileViewer(QWidget):
 
     def _process_tags(self, files):
         """파일 태그를 번역된 이름으로 처리."""
+        tag_map = self.db.tag_manager.translations_map
         for file_data in files:
             try:
                 tags = file_data.get('file_tags', '[]')
 
                 # 태그 데이터 타입 확인 및 변환
                 if isinstance(tags, str):
-                    tag_keys = json.loads(tags)  # JSON 문자열을 리스트로 변환
+                    tag_keys = _json_loads(tags)  # JSON 문자열을 리스트로 변환
                 elif isinstance(tags, list):
                     tag_keys = tags
                 else:
                     raise ValueError("Invalid tag format")
 
                 # 태그 번역
-                file_data['translated_tags'] = [
-                    self.db.tag_manager.get_tag_display_name(key) for key in tag_keys
-                ]
+                file_data['translated_tags'] = [tag_map.get(key, key) for key in tag_keys]
 
             except json.JSONDecodeError:
                 logger.error(f"Error decoding tags for file: {file_data.get('file_path', 'Unknown')}")
@@ -1193,25 +1321,25 @@ class FileViewer(QWidget):
         """이전 페이지로 이동."""      
         if self.current_page > 1:  # 1 기반으로 수정
             self.current_page -= 1
-            self.load_file_list()
+            self.load_file_list(keep_cursors=True)
 
     def next_page(self):
         """다음 페이지로 이동."""        
         if self.current_page < self.total_pages:  # 1 기반으로 수정
             self.current_page += 1
-            self.load_file_list()
+            self.load_file_list(keep_cursors=True)
 
     def first_page(self):
         """맨 첫 페이지로 이동"""
         if self.current_page != 1:  # 이미 첫 페이지라면 실행하지 않음
             self.current_page = 1
-            self.load_file_list()
+            self.load_file_list(keep_cursors=True)
 
     def last_page(self):
         """맨 마지막 페이지로 이동"""
         if self.current_page != self.total_pages:  # 이미 마지막 페이지라면 실행하지 않음
             self.current_page = self.total_pages
-            self.load_file_list()
+            self.load_file_list(keep_cursors=True)
 
     def jump_to_page(self):
         """사용자가 입력한 페이지로 정확히 이동"""
@@ -1221,7 +1349,7 @@ class FileViewer(QWidget):
                 if self.current_page != page:  # 이미 해당 페이지라면 실행하지 않음
                     self.current_page = page
                     logger.info(f"Jumping to page: {self.current_page}")
-                    self.load_file_list()  # 해당 페이지의 파일 목록 새로 로드
+                    self.load_file_list(keep_cursors=True)  # 해당 페이지의 파일 목록 새로 로드
             else:
                 QMessageBox.warning(
                     self, "Invalid Page", f"Please enter a number between 1 and {self.total_pages}."
@@ -70,6 +70,7 @@ class MainApp(QWidget):
 
             # Database와 Manager 초기화
             self.db = DatabaseManager()
+            self.db.initialize_database()
             logger.info("DatabaseManager initialized")
             self.mark_manager = self.db.mark_manager
 
@@ -158,7 +158,7 @@ class SearchManager:
         transforms = self.generate_transforms(search_value)
 
         # 동적 쿼리 생성
-        base_query = "SELECT * FROM file_data WHERE "
+        base_query = "SELECT * FROM file_data_view WHERE "
         fields = ["title", "author", "description"]
         
         # 복합 OR 조건 생성
@@ -200,7 +200,7 @@ class SearchManager:
                     values.extend(params)
 
         # 기본 SQL 쿼리 생성
-        query = "SELECT * FROM file_data"
+        query = "SELECT * FROM file_data_view"
         if conditions:
             query += f" WHERE {' AND '.join(conditions)}"
 
@@ -218,29 +218,29 @@ class SearchManager:
 
         if operator == 'empty':
             # 태그가 비어 있는 경우 검색
-            query = "file_tags IS NULL OR json_array_length(file_tags) = 0"
+            query = "NOT EXISTS (SELECT 1 FROM file_tag t WHERE t.file_path = file_data_view.file_path)"
             logger.debug(f"Empty tag query: {query}")
             return query, []
 
         if operator == 'contains':
-            # 태그가 JSON 배열 내에 존재하는 경우 검색
+            # 태그가 모두 연결된 파일 검색 (file_tag 인덱스 사용)
             conditions = []
             params = []
             for tag in tags:
-                conditions.append("EXISTS (SELECT 1 FROM json_each(file_tags) WHERE json_each.value = ?)")
+                conditions.append("EXISTS (SELECT 1 FROM file_tag t WHERE t.file_path = file_data_view.file_path AND t.tag = ?)")
                 params.append(tag)
-            query = f"file_tags IS NOT NULL AND {' AND '.join(conditions)}"
+            query = f"({' AND '.join(conditions)})"
             logger.debug(f"Contains tag query: {query} with params: {params}")
             return query, params
 
         elif operator == 'not_contains':
-            # 태그가 JSON 배열 내에 없는 경우 검색
+            # 태그가 하나도 연결되지 않은 파일 검색
             conditions = []
             params = []
             for tag in tags:
-                conditions.append("NOT EXISTS (SELECT 1 FROM json_each(file_tags) WHERE json_each.value = ?)")
+                conditions.append("NOT EXISTS (SELECT 1 FROM file_tag t WHERE t.file_path = file_data_view.file_path AND t.tag = ?)")
                 params.append(tag)
-            query = f"file_tags IS NULL OR {' AND '.join(conditions)}"
+            query = f"({' AND '.join(conditions)})"
             logger.debug(f"Not contains tag query: {query} with params: {params}")
             return query, params
 
@@ -804,8 +804,4 @@ class DataResetWindow(QWidget):
         self.db.comp_manager.reset_comps()
 
     def reset_all(self):
-        self.db.limit_manager.reset_limits()
-        self.db.mark_manager.reset_marks()
-        self.db.tag_manager.reset_file_tags()
-        self.db.time_manager.reset_play_times()
-        self.db.comp_manager.reset_comps()
\ No newline at end of file
+        self.db.reset_all()
\ No newline at end of file
@@ -5,6 +5,7 @@ import os
 import image_data
 import re
 import zipfile
+import functools
 from loguru import logger
 
 
@@ -15,6 +16,8 @@ class JapaneseZipHandler:
     KATAKANA_RANGE = re.compile(r'[\u30A0-\u30FF]')
     KANJI_RANGE = re.compile(r'[\u4E00-\u9FFF]')
     VALID_FILENAME = re.compile(r'^[\u0020-\u007E\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]+$')
+    # 감지한 인코딩이 실패했을 때 차례로 시도할 인코딩
+    BACKUP_ENCODINGS = ('cp932', 'shift_jis', 'euc_jp', 'utf-8')
 
     def __init__(self, zip_path):
         self.zip_path = zip_path
@@ -73,29 +76,15 @@ class JapaneseZipHandler:
         if not filename.lower().endswith(('.wsm', 'summary.xml')):
             return filename  # 원래 이름 그대로 반환
 
+        # ASCII 이름은 어떤 인코딩으로 다시 읽어도 같으므로 인코딩 감지와 재디코딩을 생략
+        if filename.isascii():
+            return filename
+
         if not self.encoding:
             self.detect_filename_encoding()
 
         try:
-            # cp437로 인코딩된 바이트로 변환 후 실제 인코딩으로 디코딩
-            raw_bytes = filename.encode('cp437')
-            decoded = raw_bytes.decode(self.encoding)
-            
-            if self.VALID_FILENAME.match(decoded):
-                return decoded
-
-            # 백업 인코딩 시도
-            for backup_enc in ['cp932', 'shift_jis', 'euc_jp', 'utf-8']:
-                if backup_enc == self.encoding:
-                    continue
-                try:
-                    backup_decoded = raw_bytes.decode(backup_enc)
-                    if self.VALID_FILENAME.match(backup_decoded):
-                        logger.debug(f"Backup decode successful with {backup_enc}: {backup_decoded}")
-                        return backup_decoded
-                except UnicodeDecodeError:
-                    continue
-
+            return _redecode_filename(filename, self.encoding)
         except UnicodeDecodeError as e:
             logger.error(f"Decoding error: {e}")
         
@@ -106,29 +95,14 @@ class JapaneseZipHandler:
         if not filename.lower().endswith(".txt"):
             return None  # .txt 파일이 아니면 무시
 
+        if filename.isascii():
+            return filename
+
         if not self.encoding:
             self.detect_filename_encoding()
 
         try:
-            # ✅ cp437로 인코딩된 바이트로 변환 후 self.encoding으로 디코딩
-            raw_bytes = filename.encode('cp437')  # cp437로 인코딩 시도
-            decoded = raw_bytes.decode(self.encoding)
-            
-            if self.VALID_FILENAME.match(decoded):
-                return decoded
-
-            # ✅ 백업 인코딩 순차적으로 시도
-            for backup_enc in ['cp932', 'shift_jis', 'euc_jp', 'utf-8']:
-                if backup_enc == self.encoding:
-                    continue
-                try:
-                    backup_decoded = raw_bytes.decode(backup_enc)
-                    if self.VALID_FILENAME.match(backup_decoded):
-                        logger.debug(f"Backup decode successful with {backup_enc}: {backup_decoded}")
-                        return backup_decoded
-                except UnicodeDecodeError:
-                    continue
-
+            return _redecode_filename(filename, self.encoding)
         except (UnicodeEncodeError, UnicodeDecodeError) as e:
             pass
 
@@ -141,6 +115,35 @@ class JapaneseZipHandler:
         return [(name, self.get_real_filename(name)) for name in self._zip_ref.namelist()]
 
 
+@functools.lru_cache(maxsize=4096)
+def _redecode_filename(filename, encoding):
+    """
+    zipfile이 cp437로 읽은 파일명을 encoding으로 다시 디코딩 (실패하면 백업 인코딩 순서대로 시도).
+    같은 ZIP을 다시 스캔하거나 같은 이름이 반복될 때를 위해 (파일명, 인코딩) 단위로 캐시합니다.
+    첫 디코딩의 UnicodeDecodeError는 호출 측에서 처리합니다.
+    """
+    # cp437로 인코딩된 바이트로 변환 후 실제 인코딩으로 디코딩
+    raw_bytes = filename.encode('cp437')
+    decoded = raw_bytes.decode(encoding)
+
+    if JapaneseZipHandler.VALID_FILENAME.match(decoded):
+        return decoded
+
+    # 백업 인코딩 시도
+    for backup_enc in JapaneseZipHandler.BACKUP_ENCODINGS:
+        if backup_enc == encoding:
+            continue
+        try:
+            backup_decoded = raw_bytes.decode(backup_enc)
+            if JapaneseZipHandler.VALID_FILENAME.match(backup_decoded):
+                logger.debug(f"Backup decode successful with {backup_enc}: {backup_decoded}")
+                return backup_decoded
+        except UnicodeDecodeError:
+            continue
+
+    return filename
+
+
 def to_half_width(text: str) -> str:
     """전각 문자를 반각 문자로 변환."""
     return ''.join(